@@ -6,6 +6,7 @@ from starlette.responses import JSONResponse
 from src.api import utils, contacts, auth, users
 
 app = FastAPI()
+app.state.limiter = users.limiter
 
 origins = [
     "http://localhost:8000"
@@ -24,6 +25,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Let browser clients read the pagination flag and the profile ETag.
+    expose_headers=["X-Has-Next", "ETag"],
 )
 
 app.include_router(utils.router, prefix="/api")
@@ -0,0 +1,28 @@
+"""add contacts user_id id index
+
+Revision ID: 0f6a2d8c91e4
+Revises: b58e0a4d7c93
+Create Date: 2026-10-14 20:49:21.730518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0f6a2d8c91e4'
+down_revision: Union[str, None] = 'b58e0a4d7c93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_contacts_user_id_id', 'contacts', ['user_id', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_contacts_user_id_id', table_name='contacts')
@@ -0,0 +1,33 @@
+"""add contacts birthday index
+
+Revision ID: 4d2b9e61c0a7
+Revises: 721c5a50e919
+Create Date: 2026-10-14 19:05:12.418305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4d2b9e61c0a7'
+down_revision: Union[str, None] = '721c5a50e919'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_contacts_user_birthday',
+        'contacts',
+        ['user_id', sa.text('(EXTRACT(month FROM birth_date) * 100 + EXTRACT(day FROM birth_date))')],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_contacts_user_birthday', table_name='contacts')
@@ -0,0 +1,30 @@
+"""drop contacts name indexes
+
+Revision ID: 5e9b37a0d2c4
+Revises: c81d4f2a7b36
+Create Date: 2026-10-14 21:51:09.604377
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e9b37a0d2c4'
+down_revision: Union[str, None] = 'c81d4f2a7b36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index(op.f('ix_contacts_last_name'), table_name='contacts')
+    op.drop_index(op.f('ix_contacts_first_name'), table_name='contacts')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_contacts_first_name'), 'contacts', ['first_name'], unique=False)
+    op.create_index(op.f('ix_contacts_last_name'), 'contacts', ['last_name'], unique=False)
@@ -0,0 +1,36 @@
+"""add contacts trigram indexes
+
+Revision ID: 9a1f3c7e52b8
+Revises: 4d2b9e61c0a7
+Create Date: 2026-10-14 19:32:47.902114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a1f3c7e52b8'
+down_revision: Union[str, None] = '4d2b9e61c0a7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index('contacts_first_name_trgm', 'contacts', ['first_name'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'first_name': 'gin_trgm_ops'})
+    op.create_index('contacts_last_name_trgm', 'contacts', ['last_name'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'last_name': 'gin_trgm_ops'})
+    op.create_index('contacts_email_trgm', 'contacts', ['email'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'email': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('contacts_email_trgm', table_name='contacts')
+    op.drop_index('contacts_last_name_trgm', table_name='contacts')
+    op.drop_index('contacts_first_name_trgm', table_name='contacts')
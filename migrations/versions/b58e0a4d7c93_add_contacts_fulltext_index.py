@@ -0,0 +1,32 @@
+"""add contacts full-text search index
+
+Revision ID: b58e0a4d7c93
+Revises: e37c5d90b4f1
+Create Date: 2026-10-14 20:27:39.184726
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b58e0a4d7c93'
+down_revision: Union[str, None] = 'e37c5d90b4f1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        "CREATE INDEX contacts_search_tsv_gin ON contacts USING gin "
+        "(to_tsvector('simple', coalesce(first_name, '') || ' ' || coalesce(last_name, '') || ' ' "
+        "|| translate(coalesce(email, ''), '@.', '  ')))"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('contacts_search_tsv_gin', table_name='contacts')
@@ -0,0 +1,41 @@
+"""add contacts prefix search indexes
+
+Revision ID: c81d4f2a7b36
+Revises: 0f6a2d8c91e4
+Create Date: 2026-10-14 21:32:47.118203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c81d4f2a7b36'
+down_revision: Union[str, None] = '0f6a2d8c91e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        "CREATE INDEX ix_contacts_first_name_lower_pat ON contacts "
+        "(user_id, (lower(first_name)) varchar_pattern_ops)"
+    )
+    op.execute(
+        "CREATE INDEX ix_contacts_last_name_lower_pat ON contacts "
+        "(user_id, (lower(last_name)) varchar_pattern_ops)"
+    )
+    op.execute(
+        "CREATE INDEX ix_contacts_email_lower_pat ON contacts "
+        "(user_id, (lower(email)) varchar_pattern_ops)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_contacts_email_lower_pat', table_name='contacts')
+    op.drop_index('ix_contacts_last_name_lower_pat', table_name='contacts')
+    op.drop_index('ix_contacts_first_name_lower_pat', table_name='contacts')
@@ -0,0 +1,41 @@
+"""replace contacts trigram indexes with a single search index
+
+Revision ID: e37c5d90b4f1
+Revises: 9a1f3c7e52b8
+Create Date: 2026-10-14 19:58:03.551960
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e37c5d90b4f1'
+down_revision: Union[str, None] = '9a1f3c7e52b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index('contacts_email_trgm', table_name='contacts')
+    op.drop_index('contacts_last_name_trgm', table_name='contacts')
+    op.drop_index('contacts_first_name_trgm', table_name='contacts')
+    op.execute(
+        "CREATE INDEX contacts_fullsearch_trgm ON contacts USING gin "
+        "((lower(coalesce(first_name, '') || ' ' || coalesce(last_name, '') || ' ' || coalesce(email, ''))) "
+        "gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('contacts_fullsearch_trgm', table_name='contacts')
+    op.create_index('contacts_first_name_trgm', 'contacts', ['first_name'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'first_name': 'gin_trgm_ops'})
+    op.create_index('contacts_last_name_trgm', 'contacts', ['last_name'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'last_name': 'gin_trgm_ops'})
+    op.create_index('contacts_email_trgm', 'contacts', ['email'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'email': 'gin_trgm_ops'})
@@ -12,21 +12,23 @@ Endpoints:
 
 """
 
-from sqlalchemy.orm import Session
+from cachetools import TTLCache
 from fastapi.security import OAuth2PasswordRequestForm, OAuth2PasswordBearer
 from src.schemas import UserCreate, Token, User, RequestEmail
-from src.services.auth import create_access_token, Hash, get_email_from_token, create_refresh_token, \
+from src.services.auth import create_access_token, hash_service, get_email_from_token, create_refresh_token, \
     verify_refresh_token
 from src.services.email import send_email
-from src.services.users import UserService
-from src.database.db import get_db
+from src.services.users import UserService, get_user_service
+from src.conf.config import settings
 from fastapi import APIRouter, HTTPException, Depends, status, Security, BackgroundTasks, Request
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 refresh_token_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/refresh")
+# Addresses that were sent a verification email recently, to throttle repeat requests.
+_recent_email_requests = TTLCache(maxsize=10000, ttl=settings.EMAIL_RESEND_INTERVAL_SECONDS)
 
 @router.post("/register", response_model=User, status_code=status.HTTP_201_CREATED)
-async def register_user(user_data: UserCreate, background_tasks: BackgroundTasks, request: Request, db: Session = Depends(get_db)):
+async def register_user(user_data: UserCreate, background_tasks: BackgroundTasks, request: Request, user_service: UserService = Depends(get_user_service)):
     """
         Register a new user.
 
@@ -36,27 +38,26 @@ async def register_user(user_data: UserCreate, background_tasks: BackgroundTasks
         :type background_tasks: BackgroundTasks
         :param request: FastAPI request instance.
         :type request: Request
-        :param db: Database session dependency.
-        :type db: Session
+        :param user_service: User service for the request.
+        :type user_service: UserService
         :return: Newly registered user data.
         :rtype: User
         """
-    user_service = UserService(db)
 
-    email_user = await user_service.get_user_by_email(user_data.email)
-    if email_user:
+    existing_users = await user_service.get_users_by_email_or_username(
+        user_data.email, user_data.username
+    )
+    if any(user.email == user_data.email for user in existing_users):
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Користувач з таким email вже існує",
         )
-
-    username_user = await user_service.get_user_by_username(user_data.username)
-    if username_user:
+    if existing_users:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Користувач з таким іменем вже існує",
         )
-    user_data.password = Hash().get_password_hash(user_data.password)
+    user_data.password = await hash_service.get_password_hash(user_data.password)
     new_user = await user_service.create_user(user_data)
     background_tasks.add_task(
         send_email, new_user.email, new_user.username, request.base_url
@@ -66,21 +67,25 @@ async def register_user(user_data: UserCreate, background_tasks: BackgroundTasks
 
 @router.post("/login", response_model=Token)
 async def login_user(
-    form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)
+    form_data: OAuth2PasswordRequestForm = Depends(), user_service: UserService = Depends(get_user_service)
 ):
     """
         Authenticate a user and return an access token.
 
         :param form_data: OAuth2 form data containing username and password.
         :type form_data: OAuth2PasswordRequestForm
-        :param db: Database session dependency.
-        :type db: Session
+        :param user_service: User service for the request.
+        :type user_service: UserService
         :return: Access token and token type.
         :rtype: Token
         """
-    user_service = UserService(db)
     user = await user_service.get_user_by_username(form_data.username)
-    if not user or not Hash().verify_password(form_data.password, user.hashed_password):
+    verified, new_hash = False, None
+    if user:
+        verified, new_hash = await hash_service.verify_and_update(
+            form_data.password, user.hashed_password
+        )
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Неправильний логін або пароль",
@@ -92,26 +97,28 @@ async def login_user(
             detail="Електронна адреса не підтверджена",
         )
 
-    access_token = await create_access_token(data={"sub": user.username})
-    refresh_token = await create_refresh_token(data={"sub": user.username})
-    await user_service.set_refresh_token(user.id, refresh_token)
+    if new_hash:
+        await user_service.update_password(user.id, new_hash)
+
+    access_token = create_access_token(data={"sub": user.username})
+    refresh_token = create_refresh_token(data={"sub": user.username})
+    await user_service.set_refresh_token(user.id, hash_service.hash_refresh_token(refresh_token))
     return {"access_token": access_token, "token_type": "bearer",  "refresh_token": refresh_token}
 
 
 @router.get("/confirmed_email/{token}")
-async def confirmed_email(token: str, db: Session = Depends(get_db)):
+async def confirmed_email(token: str, user_service: UserService = Depends(get_user_service)):
     """
         Confirm a user's email using a verification token.
 
         :param token: Verification token received via email.
         :type token: str
-        :param db: Database session dependency.
-        :type db: Session
+        :param user_service: User service for the request.
+        :type user_service: UserService
         :return: Confirmation message.
         :rtype: dict
         """
     email = await get_email_from_token(token)
-    user_service = UserService(db)
     user = await user_service.get_user_by_email(email)
     if user is None:
         raise HTTPException(
@@ -128,7 +135,7 @@ async def request_email(
     body: RequestEmail,
     background_tasks: BackgroundTasks,
     request: Request,
-    db: Session = Depends(get_db),
+    user_service: UserService = Depends(get_user_service),
 ):
     """
         Request an email verification link.
@@ -139,30 +146,34 @@ async def request_email(
         :type background_tasks: BackgroundTasks
         :param request: FastAPI request instance.
         :type request: Request
-        :param db: Database session dependency.
-        :type db: Session
+        :param user_service: User service for the request.
+        :type user_service: UserService
         :return: Verification email sent message.
         :rtype: dict
     """
-    user_service = UserService(db)
+    if body.email in _recent_email_requests:
+        return {"message": "Перевірте свою електронну пошту для підтвердження"}
+
     user = await user_service.get_user_by_email(body.email)
 
+    if user is None:
+        return {"message": "Перевірте свою електронну пошту для підтвердження"}
     if user.confirmed:
         return {"message": "Ваша електронна пошта вже підтверджена"}
-    if user:
-        background_tasks.add_task(
-            send_email, user.email, user.username, request.base_url
-        )
+    _recent_email_requests[body.email] = True
+    background_tasks.add_task(
+        send_email, user.email, user.username, request.base_url
+    )
     return {"message": "Перевірте свою електронну пошту для підтвердження"}
 
 
 @router.post("/token-refresh", response_model=Token)
-async def refresh(refresh_token: str = Depends(refresh_token_scheme), db: Session = Depends(get_db)):
+async def refresh(refresh_token: str = Depends(refresh_token_scheme), user_service: UserService = Depends(get_user_service)):
     """
         Refreshes the access token using a valid refresh token.
         Args:
             refresh_token (str): The refresh token.
-            db (Session): The database session.
+            user_service (UserService): The user service for the request.
 
         Raises:
             HTTPException: If the refresh token is invalid or expired.
@@ -170,7 +181,7 @@ async def refresh(refresh_token: str = Depends(refresh_token_scheme), db: Sessio
         Returns:
             dict: A new access token and refresh token.
     """
-    user = await verify_refresh_token(refresh_token, db)
+    user = await verify_refresh_token(refresh_token, user_service)
 
     if not user:
         raise HTTPException(
@@ -178,9 +189,8 @@ async def refresh(refresh_token: str = Depends(refresh_token_scheme), db: Sessio
             detail="Невалідний або прострочений refresh token",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    access_token = await create_access_token(data={"sub": user.username})
-    new_refresh_token = await create_refresh_token(data={"sub": user.username})
-    user_service = UserService(db)
-    await user_service.set_refresh_token(user.id, refresh_token)
+    access_token = create_access_token(data={"sub": user.username})
+    new_refresh_token = create_refresh_token(data={"sub": user.username})
+    await user_service.set_refresh_token(user.id, hash_service.hash_refresh_token(new_refresh_token))
 
     return {"access_token": access_token, "refresh_token": new_refresh_token, "token_type": "bearer"}
\ No newline at end of file
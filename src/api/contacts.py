@@ -8,6 +8,7 @@ This module provides endpoints for managing user contacts, including:
 - Fetching contacts with upcoming birthdays.
 - Retrieving a single contact by ID.
 - Creating a new contact.
+- Creating many contacts at once.
 - Updating an existing contact.
 - Deleting a contact.
 
@@ -16,6 +17,7 @@ Endpoints:
     - `/contacts/birthdays` (GET): Get contacts with upcoming birthdays.
     - `/contacts/{contact_id}` (GET): Retrieve a specific contact by ID.
     - `/contacts/` (POST): Create a new contact.
+    - `/contacts/bulk` (POST): Create many contacts in one request.
     - `/contacts/{contact_id}` (PUT): Update an existing contact.
     - `/contacts/{contact_id}` (DELETE): Remove a contact.
 
@@ -23,78 +25,109 @@ Endpoints:
 
 from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException, Depends, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, HTTPException, Depends, Body, Query, status, Response
+from pydantic import TypeAdapter
 
-from src.database.db import get_db
-from src.database.models import User
 from src.schemas import ContactResponse, ContactCreate, ContactUpdate
 from src.services.auth import get_current_user
-from src.services.contacts import ContactService
+from src.services.contacts import ContactService, get_contact_service
+from src.services.users import AuthUser
 
 router = APIRouter(prefix="/contacts", tags=["contacts"])
+MAX_PAGE_SIZE = 1000
+contact_list_adapter = TypeAdapter(List[ContactResponse])
+
+
+def contact_list_response(contacts, status_code: int = status.HTTP_200_OK) -> Response:
+    """
+        Serialize a list of contacts to a JSON response in a single pass.
+
+        Returning a ready ``Response`` skips FastAPI's own per-item validation and
+        encoding of the ``response_model``.
+
+        :param contacts: Contacts loaded from the database.
+        :param status_code: HTTP status code of the response.
+        :return: JSON response with the serialized contacts.
+        :rtype: Response
+    """
+    validated = contact_list_adapter.validate_python(contacts, from_attributes=True)
+    return Response(
+        content=contact_list_adapter.dump_json(validated),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
 
 @router.get("/", response_model=List[ContactResponse])
 async def read_contacts(
         skip: int = 0,
-        limit: int = 100,
+        limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
         query: Optional[str]=None,
-        db: AsyncSession = Depends(get_db),
-        user: User = Depends(get_current_user)):
+        after_id: Optional[int]=None,
+        contact_service: ContactService = Depends(get_contact_service),
+        user: AuthUser = Depends(get_current_user)):
     """
         Retrieve a list of contacts.
 
+        The ``X-Has-Next`` response header tells whether another page follows.
+
         :param skip: Number of records to skip.
         :type skip: int
-        :param limit: Maximum number of contacts to return.
+        :param limit: Maximum number of contacts to return (1 to ``MAX_PAGE_SIZE``).
         :type limit: int
         :param query: Optional search query.
         :type query: Optional[str]
-        :param db: Database session.
-        :type db: AsyncSession
+        :param after_id: ID of the last contact on the previous page; takes precedence over skip.
+        :type after_id: Optional[int]
+        :param contact_service: Contact service for the request.
+        :type contact_service: ContactService
         :param user: Authenticated user.
-        :type user: User
+        :type user: AuthUser
         :return: List of contacts.
         :rtype: List[ContactResponse]
     """
-    contact_service = ContactService(db)
-    contacts = await contact_service.get_contacts(skip, limit, user, query)
-    return contacts
+    contacts, has_next = await contact_service.get_contacts(skip, limit, user, query, after_id)
+    response = contact_list_response(contacts)
+    response.headers["X-Has-Next"] = "true" if has_next else "false"
+    return response
 
 @router.get("/birthdays", response_model=List[ContactResponse])
-async def get_birthdays(db: AsyncSession = Depends(get_db), user: User = Depends(get_current_user)):
+async def get_birthdays(
+        limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+        contact_service: ContactService = Depends(get_contact_service),
+        user: AuthUser = Depends(get_current_user)):
     """
        Retrieve contacts with upcoming birthdays.
 
-       :param db: Database session.
-       :type db: AsyncSession
+       :param limit: Maximum number of contacts to return (1 to ``MAX_PAGE_SIZE``).
+       :type limit: int
+       :param contact_service: Contact service for the request.
+       :type contact_service: ContactService
        :param user: Authenticated user.
-       :type user: User
+       :type user: AuthUser
        :return: List of contacts with upcoming birthdays.
        :rtype: List[ContactResponse]
     """
-    contact_service = ContactService(db)
-    contacts = await contact_service.get_birthdays(user)
-    return contacts
+    contacts = await contact_service.get_birthdays(user, limit)
+    return contact_list_response(contacts)
 
 @router.get("/{contact_id}", response_model=ContactResponse)
 async def read_contact(
         contact_id: int,
-        db: AsyncSession = Depends(get_db),
-        user: User = Depends(get_current_user)):
+        contact_service: ContactService = Depends(get_contact_service),
+        user: AuthUser = Depends(get_current_user)):
     """
        Retrieve a contact by ID.
 
        :param contact_id: ID of the contact.
        :type contact_id: int
-       :param db: Database session.
-       :type db: AsyncSession
+       :param contact_service: Contact service for the request.
+       :type contact_service: ContactService
        :param user: Authenticated user.
-       :type user: User
+       :type user: AuthUser
        :return: Contact details.
        :rtype: ContactResponse
        """
-    contact_service = ContactService(db)
     contact = await contact_service.get_contact(contact_id, user)
     if contact is None:
         raise HTTPException(
@@ -105,29 +138,48 @@ async def read_contact(
 @router.post("/", response_model=ContactResponse, status_code=status.HTTP_201_CREATED)
 async def create_contact(
         body: ContactCreate,
-        db: AsyncSession = Depends(get_db),
-        user: User = Depends(get_current_user)):
+        contact_service: ContactService = Depends(get_contact_service),
+        user: AuthUser = Depends(get_current_user)):
     """
       Create a new contact.
 
       :param body: Contact creation details.
       :type body: ContactCreate
-      :param db: Database session.
-      :type db: AsyncSession
+      :param contact_service: Contact service for the request.
+      :type contact_service: ContactService
       :param user: Authenticated user.
-      :type user: User
+      :type user: AuthUser
       :return: Newly created contact.
       :rtype: ContactResponse
     """
-    contact_service = ContactService(db)
     return await contact_service.create_contact(body, user)
 
+@router.post("/bulk", response_model=List[ContactResponse], status_code=status.HTTP_201_CREATED)
+async def create_contacts_bulk(
+        body: List[ContactCreate] = Body(..., max_length=MAX_PAGE_SIZE),
+        contact_service: ContactService = Depends(get_contact_service),
+        user: AuthUser = Depends(get_current_user)):
+    """
+      Create many contacts in a single database round trip.
+
+      :param body: Details of each contact to create (at most ``MAX_PAGE_SIZE``).
+      :type body: List[ContactCreate]
+      :param contact_service: Contact service for the request.
+      :type contact_service: ContactService
+      :param user: Authenticated user.
+      :type user: AuthUser
+      :return: Newly created contacts.
+      :rtype: List[ContactResponse]
+    """
+    contacts = await contact_service.create_contacts_bulk(body, user)
+    return contact_list_response(contacts, status.HTTP_201_CREATED)
+
 @router.put("/{contact_id}", response_model=ContactResponse)
 async def update_contact(
         body: ContactUpdate,
-        contact_id: int, db:
-        AsyncSession = Depends(get_db),
-        user: User = Depends(get_current_user)):
+        contact_id: int,
+        contact_service: ContactService = Depends(get_contact_service),
+        user: AuthUser = Depends(get_current_user)):
     """
       Update an existing contact.
 
@@ -135,14 +187,13 @@ async def update_contact(
       :type body: ContactUpdate
       :param contact_id: ID of the contact to update.
       :type contact_id: int
-      :param db: Database session.
-      :type db: AsyncSession
+      :param contact_service: Contact service for the request.
+      :type contact_service: ContactService
       :param user: Authenticated user.
-      :type user: User
+      :type user: AuthUser
       :return: Updated contact.
       :rtype: ContactResponse
     """
-    contact_service = ContactService(db)
     contact = await contact_service.update_contact(contact_id, body, user)
     if contact is None:
         raise HTTPException(
@@ -153,21 +204,20 @@ async def update_contact(
 @router.delete("/{contact_id}", response_model=ContactResponse)
 async def remove_contact(
         contact_id: int,
-        db: AsyncSession = Depends(get_db),
-        user: User = Depends(get_current_user)):
+        contact_service: ContactService = Depends(get_contact_service),
+        user: AuthUser = Depends(get_current_user)):
     """
        Remove a contact.
 
        :param contact_id: ID of the contact to remove.
        :type contact_id: int
-       :param db: Database session.
-       :type db: AsyncSession
+       :param contact_service: Contact service for the request.
+       :type contact_service: ContactService
        :param user: Authenticated user.
-       :type user: User
+       :type user: AuthUser
        :return: Deleted contact details.
        :rtype: ContactResponse
     """
-    contact_service = ContactService(db)
     contact = await contact_service.remove_contact(contact_id, user)
     if contact is None:
         raise HTTPException(
@@ -13,42 +13,54 @@ Endpoints:
 
 """
 
-from fastapi import APIRouter, Depends, Request, UploadFile, File
+import hashlib
+
+from fastapi import APIRouter, Depends, Request, Response, UploadFile, File, status
+from fastapi.concurrency import run_in_threadpool
 from slowapi.util import get_remote_address
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.conf.config import settings
-from src.database.db import get_db
 from src.schemas import User
 from src.services.auth import get_current_user, get_current_admin_user
 from slowapi import Limiter
 
 from src.services.upload_file import UploadFileService
-from src.services.users import UserService
+from src.services.users import AuthUser, UserService, get_user_service
 
 router = APIRouter(prefix="/users", tags=["users"])
-limiter = Limiter(key_func=get_remote_address)
+limiter = Limiter(key_func=get_remote_address, storage_uri=settings.RATE_LIMIT_STORAGE_URI)
+upload_service = UploadFileService(
+    settings.CLD_NAME, settings.CLD_API_KEY, settings.CLD_API_SECRET
+)
 
 @router.get("/me", response_model=User)
 @limiter.limit("5/minute")
-async def me(request: Request, user: User = Depends(get_current_user)):
+async def me(request: Request, user: AuthUser = Depends(get_current_user)):
     """
        Retrieve the authenticated user's details.
 
+       The response carries an ``ETag``; a request with a matching
+       ``If-None-Match`` header gets ``304 Not Modified`` without a body.
+
        :param request: The incoming request object.
        :type request: Request
        :param user: The authenticated user.
-       :type user: User
+       :type user: AuthUser
        :return: The authenticated user's details.
        :rtype: User
     """
-    return user
+    body = User.model_validate(user).model_dump_json()
+    etag = f'"{hashlib.sha1(body.encode()).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "private, max-age=30"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 @router.patch("/avatar", response_model=User)
 async def update_avatar_user(
     file: UploadFile = File(),
-    user: User = Depends(get_current_admin_user),
-    db: AsyncSession = Depends(get_db),
+    user: AuthUser = Depends(get_current_admin_user),
+    user_service: UserService = Depends(get_user_service),
 ):
     """
        Update the authenticated user's avatar.
@@ -56,17 +68,14 @@ async def update_avatar_user(
        :param file: The uploaded avatar file.
        :type file: UploadFile
        :param user: The authenticated user.
-       :type user: User
-       :param db: Database session.
-       :type db: AsyncSession
+       :type user: AuthUser
+       :param user_service: User service for the request.
+       :type user_service: UserService
        :return: The updated user with the new avatar URL.
        :rtype: User
     """
-    avatar_url = UploadFileService(
-        settings.CLD_NAME, settings.CLD_API_KEY, settings.CLD_API_SECRET
-    ).upload_file(file, user.username)
+    avatar_url = await run_in_threadpool(upload_service.upload_file, file, user.username)
 
-    user_service = UserService(db)
     user = await user_service.update_avatar_url(user.email, avatar_url)
 
     return user
\ No newline at end of file
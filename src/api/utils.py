@@ -9,13 +9,21 @@ Endpoints:
 
 """
 
+import logging
+import time
+
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 
+from src.conf.config import settings
 from src.database.db import get_db
 
 router = APIRouter(tags=["utils"])
+logger = logging.getLogger(__name__)
+
+# Monotonic time of the last successful database check; failures are never cached.
+_last_healthy_at = None
 
 @router.get("/healthchecker")
 async def healthchecker(db: AsyncSession = Depends(get_db)):
@@ -28,6 +36,9 @@ async def healthchecker(db: AsyncSession = Depends(get_db)):
        :rtype: dict
        :raises HTTPException: If the database is not configured correctly or there is an error connecting.
     """
+    global _last_healthy_at
+    if _last_healthy_at is not None and time.monotonic() - _last_healthy_at < settings.HEALTHCHECK_CACHE_SECONDS:
+        return {"message": "Welcome to FastAPI!"}
     try:
         result = await db.execute(text("SELECT 1"))
         result = result.scalar_one_or_none()
@@ -37,9 +48,11 @@ async def healthchecker(db: AsyncSession = Depends(get_db)):
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Database is not configured correctly",
             )
+        _last_healthy_at = time.monotonic()
         return {"message": "Welcome to FastAPI!"}
-    except Exception as e:
-        print(e)
+    except Exception:
+        _last_healthy_at = None
+        logger.exception("Healthcheck failed")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Error connecting to the database",
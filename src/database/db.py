@@ -8,14 +8,17 @@ Classes:
     - `DatabaseSessionManager`: Manages database sessions and connections.
 
 Functions:
+    - `engine_options()`: Builds the engine pool options from the settings.
     - `get_db()`: Provides an asynchronous database session generator.
 
 """
 
 import contextlib
 from typing import Union
+from uuid import uuid4
 
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.pool import NullPool
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     async_sessionmaker,
@@ -31,11 +34,12 @@ class DatabaseSessionManager:
 
         :param url: The database connection URL.
         :type url: str
+        :param engine_kwargs: Extra options passed to ``create_async_engine`` (pool sizing etc.).
     """
-    def __init__(self, url: str):
-        self._engine: Union[AsyncEngine, None] = create_async_engine(url)
+    def __init__(self, url: str, **engine_kwargs):
+        self._engine: Union[AsyncEngine, None] = create_async_engine(url, **engine_kwargs)
         self._session_maker: async_sessionmaker = async_sessionmaker(
-            autoflush=False, autocommit=False, bind=self._engine
+            autoflush=False, autocommit=False, expire_on_commit=False, bind=self._engine
         )
 
     @contextlib.asynccontextmanager
@@ -57,7 +61,35 @@ class DatabaseSessionManager:
         finally:
             await session.close()
 
-sessionmanager = DatabaseSessionManager(settings.DB_URL)
+def engine_options() -> dict:
+    """
+        Builds the ``create_async_engine`` options from the settings.
+
+        Behind PgBouncer in transaction mode the pooling is left to PgBouncer, so the
+        engine opens a connection per session and asyncpg's statement caches are off.
+        Prepared statements also get unique names: asyncpg numbers them per client
+        connection, so names would collide on a server connection PgBouncer shares.
+
+        :return: Keyword arguments for ``create_async_engine``.
+        :rtype: dict
+    """
+    if settings.DB_USE_PGBOUNCER:
+        return {
+            "poolclass": NullPool,
+            "connect_args": {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+            },
+        }
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": True,
+    }
+
+sessionmanager = DatabaseSessionManager(settings.DB_URL, **engine_options())
 
 async def get_db():
     """
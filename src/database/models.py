@@ -11,7 +11,7 @@ Classes:
 
 """
 from enum import Enum
-from sqlalchemy import Column, Integer, String, Boolean, func, Table
+from sqlalchemy import Column, Integer, String, Boolean, func, Table, Index, extract, literal_column, text
 from sqlalchemy.orm import relationship, DeclarativeBase, declarative_base
 from sqlalchemy.sql.schema import ForeignKey
 from sqlalchemy.sql.sqltypes import DateTime, Date, Enum as SqlEnum
@@ -39,14 +39,14 @@ class Contact(Base):
     __tablename__ = "contacts"
 
     id = Column(Integer, primary_key=True, index=True)
-    first_name = Column(String, index=True)
-    last_name = Column(String, index=True)
+    first_name = Column(String)
+    last_name = Column(String)
     email = Column(String, unique=True, index=True)
     phone = Column(String)
     birth_date = Column(Date)
     additional_data = Column(String, nullable=True)
     user_id = Column("user_id", ForeignKey("users.id", ondelete="CASCADE"), default=None)
-    user = relationship("User", backref="notes")
+    user = relationship("User", backref="notes", lazy="raise")
 
 
 class UserRole(str, Enum):
@@ -77,3 +77,62 @@ class User(Base):
     confirmed = Column(Boolean, default=False)
     role = Column(SqlEnum(UserRole), default=UserRole.USER, nullable=False)
     refresh_token = Column(String(255), nullable=True)
+
+
+# Serves per-user listing ordered by id (offset and keyset pagination) and id lookups.
+Index("ix_contacts_user_id_id", Contact.user_id, Contact.id)
+
+# Birthday as a month * 100 + day integer (e.g. 1231), so upcoming birthdays can be
+# matched regardless of birth year. The literal keeps the expression identical to the
+# indexed one when the query is prepared with bound parameters.
+contact_birthday_key = (
+    extract("month", Contact.birth_date) * literal_column("100") + extract("day", Contact.birth_date)
+)
+
+Index("ix_contacts_user_birthday", Contact.user_id, contact_birthday_key)
+
+# "first last email" text used by the contact search. Each field is coalesced so a
+# NULL one does not make the whole text NULL. The separators and empty strings are
+# inline SQL text so the query expressions match the indexed ones exactly.
+contact_search_fields = (
+    func.coalesce(Contact.first_name, text("''")) + text("' '")
+    + func.coalesce(Contact.last_name, text("''")) + text("' '")
+    + func.coalesce(Contact.email, text("''"))
+)
+contact_search_text = func.lower(contact_search_fields)
+# Same fields for full-text search, with the email split at "@" and "." so each part
+# of the address is its own word; the parser would otherwise keep it as one token.
+contact_search_vector = func.to_tsvector(
+    text("'simple'"),
+    func.coalesce(Contact.first_name, text("''")) + text("' '")
+    + func.coalesce(Contact.last_name, text("''")) + text("' '")
+    + func.translate(func.coalesce(Contact.email, text("''")), text("'@.'"), text("'  '")),
+)
+
+# Trigram index (pg_trgm) so the ILIKE '%query%' contact search can use an index.
+Index(
+    "contacts_fullsearch_trgm", contact_search_text.label("fullsearch"),
+    postgresql_using="gin", postgresql_ops={"fullsearch": "gin_trgm_ops"},
+)
+
+# Full-text index for whole-word searches; to_tsvector only exists in PostgreSQL.
+Index("contacts_search_tsv_gin", contact_search_vector, postgresql_using="gin").ddl_if(dialect="postgresql")
+
+# Lower-cased fields for prefix (autocomplete) searches. varchar_pattern_ops lets
+# LIKE 'prefix%' use these B-tree indexes whatever the database collation.
+contact_first_name_lower = func.lower(Contact.first_name)
+contact_last_name_lower = func.lower(Contact.last_name)
+contact_email_lower = func.lower(Contact.email)
+
+Index(
+    "ix_contacts_first_name_lower_pat", Contact.user_id, contact_first_name_lower.label("first_name_lower"),
+    postgresql_ops={"first_name_lower": "varchar_pattern_ops"},
+)
+Index(
+    "ix_contacts_last_name_lower_pat", Contact.user_id, contact_last_name_lower.label("last_name_lower"),
+    postgresql_ops={"last_name_lower": "varchar_pattern_ops"},
+)
+Index(
+    "ix_contacts_email_lower_pat", Contact.user_id, contact_email_lower.label("email_lower"),
+    postgresql_ops={"email_lower": "varchar_pattern_ops"},
+)
@@ -5,20 +5,59 @@ Contact Repository
 This module provides database operations for managing contacts.
 
 Classes:
+    - `ContactOwner`: Protocol for the user a contact belongs to.
     - `ContactRepository`: Handles CRUD operations for contacts.
 
 """
 
-from datetime import datetime, timedelta
-from typing import List, Optional
+import re
+from datetime import date, timedelta
+from typing import List, Optional, Protocol, Tuple
 from typing import Union
 
-from sqlalchemy import select, or_
+from sqlalchemy import select, or_, case, func, update, delete, insert, lambda_stmt
+from sqlalchemy.engine import RowMapping
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.database.models import Contact, User
+from src.database.models import (
+    Contact,
+    contact_birthday_key,
+    contact_email_lower,
+    contact_first_name_lower,
+    contact_last_name_lower,
+    contact_search_text,
+    contact_search_vector,
+)
 from src.schemas import ContactUpdate, ContactCreate
 
+# Columns returned by contact list queries, i.e. the fields of ContactResponse.
+CONTACT_LIST_COLUMNS = (
+    Contact.id,
+    Contact.first_name,
+    Contact.last_name,
+    Contact.email,
+    Contact.phone,
+    Contact.birth_date,
+    Contact.additional_data,
+)
+
+# A search made only of letters/digits and spaces, i.e. without LIKE wildcards or punctuation.
+WORD_QUERY = re.compile(r"[^\W_]+(?:\s+[^\W_]+)*")
+# Trigram indexes cannot serve searches shorter than three characters, so such
+# single-token queries are matched as prefixes instead.
+PREFIX_QUERY_MAX_LENGTH = 2
+LIKE_SPECIAL_CHARS = re.compile(r"([\\%_])")
+
+
+class ContactOwner(Protocol):
+    """
+    The owner of contacts; only its ID is used.
+
+    Satisfied by both the ORM ``User`` and the cached ``AuthUser`` snapshot.
+    """
+    id: int
+
+
 class ContactRepository:
     """
     Repository class for handling contact-related database operations.
@@ -35,121 +74,207 @@ class ContactRepository:
         """
         self.db = session
 
-    async def get_contacts(self, skip: int, limit: int, user: User, query: Optional[str] = None) -> List[Contact]:
+    async def get_contacts(
+            self,
+            skip: int,
+            limit: int,
+            user: ContactOwner,
+            query: Optional[str] = None,
+            after_id: Optional[int] = None) -> Tuple[List[RowMapping], bool]:
         """
         Retrieves a list of contacts for a user with optional search query.
 
+        The statement is built with ``lambda_stmt``, so its SQL is compiled once per
+        combination of filters and reused with new parameters.
+
+        Only the response columns are selected and returned as row mappings, so no
+        ORM objects are built for list pages.
+
+        One row more than ``limit`` is fetched to tell whether a next page exists,
+        so no separate COUNT query is needed.
+
+        Contacts are ordered by ID. Passing ``after_id`` (the last ID of the previous
+        page) uses keyset pagination, which stays cheap for deep pages, unlike ``skip``.
+
+        Single-token queries of at most ``PREFIX_QUERY_MAX_LENGTH`` characters match the
+        start of the first name, last name or email. On PostgreSQL other queries made of
+        whole words are matched with full-text search only, each word as a prefix of a
+        word in the name or email (``ivan iv`` finds "Ivan Ivanov", ``gmail`` finds
+        "ivan@gmail.com"). Anything else falls back to a substring match over first
+        name, last name and email.
+
         Args:
             skip (int): Number of records to skip.
             limit (int): Maximum number of records to retrieve.
-            user (User): The owner of the contacts.
+            user (ContactOwner): The owner of the contacts.
             query (Optional[str]): Search term to filter contacts by name or email.
+            after_id (Optional[int]): Only return contacts with an ID greater than this.
 
         Returns:
-            List[Contact]: List of contact objects.
+            Tuple[List[RowMapping], bool]: The contact rows, and whether more rows follow them.
         """
-        stmt = select(Contact).filter_by(user=user).offset(skip).limit(limit)
+        user_id = user.id
+        fetch_limit = limit + 1
+        stmt = lambda_stmt(
+            lambda: select(*CONTACT_LIST_COLUMNS).where(Contact.user_id == user_id).order_by(Contact.id).limit(fetch_limit)
+        )
+        if after_id is not None:
+            stmt += lambda s: s.where(Contact.id > after_id)
+        elif skip:
+            stmt += lambda s: s.offset(skip)
         if query:
-            stmt = stmt.filter(
-                or_(
-                    Contact.first_name.ilike(f"%{query}%"),
-                    Contact.last_name.ilike(f"%{query}%"),
-                    Contact.email.ilike(f"%{query}%")
-                )
-            )
+            query = query.strip()
+            if len(query) <= PREFIX_QUERY_MAX_LENGTH and len(query.split()) == 1:
+                prefix = LIKE_SPECIAL_CHARS.sub(r"\\\1", query.lower()) + "%"
+                stmt += lambda s: s.where(or_(
+                    contact_first_name_lower.like(prefix, escape="\\"),
+                    contact_last_name_lower.like(prefix, escape="\\"),
+                    contact_email_lower.like(prefix, escape="\\"),
+                ))
+            elif self.db.bind.dialect.name == "postgresql" and WORD_QUERY.fullmatch(query):
+                terms = " & ".join(f"{word}:*" for word in query.split())
+                stmt += lambda s: s.where(contact_search_vector.op("@@")(func.to_tsquery("simple", terms)))
+            else:
+                pattern = f"%{query.lower()}%"
+                stmt += lambda s: s.where(contact_search_text.ilike(pattern))
         contacts = await self.db.execute(stmt)
-        return contacts.scalars().all()
+        contacts = contacts.mappings().all()
+        return contacts[:limit], len(contacts) > limit
 
-    async def get_contact_by_id(self, contact_id: int, user: User) -> Union[Contact, None]:
+    async def get_contact_by_id(self, contact_id: int, user: ContactOwner) -> Union[Contact, None]:
         """
         Retrieves a contact by its ID.
 
         Args:
             contact_id (int): The ID of the contact.
-            user (User): The owner of the contact.
+            user (ContactOwner): The owner of the contact.
 
         Returns:
             Union[Contact, None]: The contact object if found, otherwise None.
         """
-        stmt = select(Contact).filter_by(id=contact_id, user=user)
+        user_id = user.id
+        stmt = lambda_stmt(
+            lambda: select(Contact).where(Contact.id == contact_id, Contact.user_id == user_id)
+        )
         contact = await self.db.execute(stmt)
         return contact.scalar_one_or_none()
 
-    async def create_contact(self, body: ContactCreate, user: User) -> Contact:
+    async def create_contact(self, body: ContactCreate, user: ContactOwner) -> Contact:
         """
         Creates a new contact for the user.
 
         Args:
             body (ContactCreate): The contact details.
-            user (User): The owner of the contact.
+            user (ContactOwner): The owner of the contact.
 
         Returns:
             Contact: The created contact object.
         """
-        contact = Contact(**body.model_dump(exclude_unset=True), user=user)
+        data = {field: getattr(body, field) for field in body.model_fields_set}
+        contact = Contact(**data, user_id=user.id)
         self.db.add(contact)
         await self.db.commit()
         await self.db.refresh(contact)
         return contact
 
-    async def update_contact(self, contact_id: int, body: ContactUpdate, user: User) -> Union[Contact, None]:
+    async def create_contacts_bulk(self, bodies: List[ContactCreate], user: ContactOwner) -> List[Contact]:
+        """
+        Creates many contacts for the user with one multi-row INSERT ... RETURNING and one commit.
+
+        Args:
+            bodies (List[ContactCreate]): The details of each contact.
+            user (ContactOwner): The owner of the contacts.
+
+        Returns:
+            List[Contact]: The created contacts, in the order of ``bodies``.
+        """
+        if not bodies:
+            return []
+        rows = [{**body.model_dump(), "user_id": user.id} for body in bodies]
+        stmt = insert(Contact).returning(Contact, sort_by_parameter_order=True)
+        contacts = await self.db.scalars(stmt, rows)
+        contacts = contacts.all()
+        await self.db.commit()
+        return contacts
+
+    async def update_contact(self, contact_id: int, body: ContactUpdate, user: ContactOwner) -> Union[Contact, None]:
         """
-        Updates an existing contact's details.
+        Updates an existing contact's details in a single UPDATE ... RETURNING statement.
+
+        Only the fields set in ``body`` are changed.
 
         Args:
             contact_id (int): The ID of the contact.
             body (ContactUpdate): The new contact details.
-            user (User): The owner of the contact.
+            user (ContactOwner): The owner of the contact.
 
         Returns:
             Union[Contact, None]: The updated contact object if found, otherwise None.
         """
-        contact = await self.get_contact_by_id(contact_id, user)
-        if contact:
-            contact.first_name = body.first_name
-            contact.last_name = body.last_name
-            contact.email = body.email
-            contact.phone = body.phone
-            contact.birth_date = body.birth_date
-            contact.additional_data = body.additional_data
-            await self.db.commit()
-            await self.db.refresh(contact)
+        values = body.model_dump(exclude_unset=True)
+        if not values:
+            return await self.get_contact_by_id(contact_id, user)
+        stmt = (
+            update(Contact)
+            .where(Contact.id == contact_id, Contact.user_id == user.id)
+            .values(**values)
+            .returning(Contact)
+        )
+        result = await self.db.execute(stmt)
+        contact = result.scalar_one_or_none()
+        await self.db.commit()
         return contact
 
-    async def remove_contact(self, contact_id: int, user: User) -> Union[Contact, None]:
+    async def remove_contact(self, contact_id: int, user: ContactOwner) -> Union[Contact, None]:
         """
-        Deletes a contact by its ID.
+        Deletes a contact by its ID in a single DELETE ... RETURNING statement.
 
         Args:
             contact_id (int): The ID of the contact to delete.
-            user (User): The owner of the contact.
+            user (ContactOwner): The owner of the contact.
 
         Returns:
             Union[Contact, None]: The deleted contact object if found, otherwise None.
         """
-        contact = await self.get_contact_by_id(contact_id, user)
-        if contact:
-            await self.db.delete(contact)
-            await self.db.commit()
+        stmt = (
+            delete(Contact)
+            .where(Contact.id == contact_id, Contact.user_id == user.id)
+            .returning(Contact)
+        )
+        result = await self.db.execute(stmt)
+        contact = result.scalar_one_or_none()
+        await self.db.commit()
         return contact
 
-    async def get_birthdays(self, user: User) -> List[Contact]:
+    async def get_birthdays(self, user: ContactOwner, limit: int = 100) -> List[Contact]:
         """
         Retrieves contacts with upcoming birthdays in the next 7 days.
 
+        Birthdays are compared by month and day only, so the birth year does not matter,
+        and the window wraps correctly over the new year.
+
         Args:
-            user (User): The owner of the contacts.
+            user (ContactOwner): The owner of the contacts.
+            limit (int): Maximum number of records to retrieve.
 
         Returns:
-            List[Contact]: List of contacts with upcoming birthdays.
+            List[Contact]: List of contacts with upcoming birthdays, soonest first.
         """
-        today = datetime.today()
-        week = today + timedelta(days=7)
+        today = date.today()
+        end_date = today + timedelta(days=8)
+        start = today.month * 100 + today.day
+        end = end_date.month * 100 + end_date.day
 
-        stmt = select(Contact).filter_by(user=user).filter(
-            Contact.birth_date >= today,
-            Contact.birth_date <= week
-        ).order_by(Contact.birth_date)
+        # Half-open range [today, today + 8 days) so both bounds stay index range conditions.
+        stmt = select(Contact).where(Contact.user_id == user.id)
+        if start < end:
+            stmt = stmt.filter(
+                contact_birthday_key >= start, contact_birthday_key < end
+            ).order_by(contact_birthday_key)
+        else:
+            stmt = stmt.filter(
+                or_(contact_birthday_key >= start, contact_birthday_key < end)
+            ).order_by(case((contact_birthday_key >= start, 0), else_=1), contact_birthday_key)
 
-        result = await self.db.execute(stmt)
+        result = await self.db.execute(stmt.limit(limit))
         return result.scalars().all()
@@ -10,9 +10,9 @@ Classes:
 
 """
 
-from typing import Union
+from typing import List, Optional, Union
 
-from sqlalchemy import select
+from sqlalchemy import select, or_, update, lambda_stmt
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models import User
@@ -40,15 +40,16 @@ class UserRepository:
         """
         Retrieves a user by their unique ID.
 
+        Uses the session's identity map first, so a user already loaded in this
+        session is returned without a query.
+
         Args:
             user_id (int): The ID of the user.
 
         Returns:
             Union[User, None]: The User object if found, else None.
         """
-        stmt = select(User).filter_by(id=user_id)
-        user = await self.db.execute(stmt)
-        return user.scalar_one_or_none()
+        return await self.db.get(User, user_id)
 
 
     async def get_user_by_username(self, username: str) -> Union[User, None]:
@@ -61,7 +62,7 @@ class UserRepository:
         Returns:
             Union[User, None]: The User object if found, else None.
         """
-        stmt = select(User).filter_by(username=username)
+        stmt = lambda_stmt(lambda: select(User).where(User.username == username))
         user = await self.db.execute(stmt)
         return user.scalar_one_or_none()
 
@@ -76,11 +77,27 @@ class UserRepository:
         Returns:
             Union[User, None]: The User object if found, else None.
         """
-        stmt = select(User).filter_by(email=email)
+        stmt = lambda_stmt(lambda: select(User).where(User.email == email))
         user = await self.db.execute(stmt)
         return user.scalar_one_or_none()
 
 
+    async def get_users_by_email_or_username(self, email: str, username: str) -> List[User]:
+        """
+        Retrieves users matching either the given email or username in a single query.
+
+        Args:
+            email (str): The email address to look up.
+            username (str): The username to look up.
+
+        Returns:
+            List[User]: Users whose email or username matches (at most two).
+        """
+        stmt = select(User).filter(or_(User.email == email, User.username == username))
+        users = await self.db.execute(stmt)
+        return users.scalars().all()
+
+
     async def create_user(self, body: UserCreate, avatar: str = None) -> User:
         """
         Creates a new user in the database.
@@ -92,8 +109,9 @@ class UserRepository:
         Returns:
             User: The newly created User object.
         """
+        data = {field: getattr(body, field) for field in body.model_fields_set - {"password"}}
         user = User(
-            **body.model_dump(exclude_unset=True, exclude={"password"}),
+            **data,
             hashed_password=body.password,
             avatar=avatar
         )
@@ -103,21 +121,26 @@ class UserRepository:
         return user
 
 
-    async def confirmed_email(self, email: str) -> None:
+    async def confirmed_email(self, email: str) -> Optional[str]:
         """
         Marks a user's email as confirmed.
 
         Args:
             email (str): The email address of the user.
+
+        Returns:
+            Optional[str]: The username of the updated user, or None if there is none.
         """
-        user = await self.get_user_by_email(email)
-        user.confirmed = True
+        stmt = update(User).where(User.email == email).values(confirmed=True).returning(User.username)
+        result = await self.db.execute(stmt)
+        username = result.scalar_one_or_none()
         await self.db.commit()
+        return username
 
 
     async def update_avatar_url(self, email: str, url: str) -> User:
         """
-        Updates the avatar URL of a user.
+        Updates the avatar URL of a user in a single UPDATE ... RETURNING statement.
 
         Args:
             email (str): The email address of the user.
@@ -126,22 +149,43 @@ class UserRepository:
         Returns:
             User: The updated User object.
         """
-        user = await self.get_user_by_email(email)
-        user.avatar = url
+        stmt = update(User).where(User.email == email).values(avatar=url).returning(User)
+        result = await self.db.execute(stmt)
+        user = result.scalar_one()
         await self.db.commit()
-        await self.db.refresh(user)
         return user
 
 
-    async def set_refresh_token(self, user_id: int, refresh_token: str) -> None:
+    async def set_refresh_token(self, user_id: int, refresh_token: str) -> Optional[str]:
         """
         Updates the refresh token for a user.
 
         Args:
             user_id (int): The ID of the user to update.
             refresh_token (str): The new refresh token.
+
+        Returns:
+            Optional[str]: The username of the updated user, or None if there is none.
         """
-        user = await self.get_user_by_id(user_id)
-        if user:
-            user.refresh_token = refresh_token
-            await self.db.commit()
\ No newline at end of file
+        stmt = update(User).where(User.id == user_id).values(refresh_token=refresh_token).returning(User.username)
+        result = await self.db.execute(stmt)
+        username = result.scalar_one_or_none()
+        await self.db.commit()
+        return username
+
+    async def update_password(self, user_id: int, hashed_password: str) -> Optional[str]:
+        """
+        Replaces the stored password hash of a user.
+
+        Args:
+            user_id (int): The ID of the user to update.
+            hashed_password (str): The new password hash.
+
+        Returns:
+            Optional[str]: The username of the updated user, or None if there is none.
+        """
+        stmt = update(User).where(User.id == user_id).values(hashed_password=hashed_password).returning(User.username)
+        result = await self.db.execute(stmt)
+        username = result.scalar_one_or_none()
+        await self.db.commit()
+        return username
@@ -34,8 +34,7 @@ class ContactBase(BaseModel):
     birth_date: datetime
     additional_data: Optional[str] = None
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class ContactCreate(ContactBase):
     """
@@ -55,9 +54,7 @@ class ContactUpdate(BaseModel):
     birth_date: Optional[datetime] = None
     additional_data: Optional[str] = None
 
-
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ContactResponse(ContactBase):
@@ -66,8 +63,7 @@ class ContactResponse(ContactBase):
     """
     id: int
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class User(BaseModel):
@@ -7,39 +7,93 @@ JWT token generation and validation, and retrieving the current user.
 
 Classes
 -------
-- Hash: Handles password hashing and verification.
+- Hash: Handles password hashing and verification; ``hash_service`` is the shared instance.
 
 Functions
 ---------
 - create_access_token: Generates a JWT access token.
+- decode_access_token: Verifies an access token, caching the payload briefly.
+- decode_refresh_token: Verifies a refresh token, caching the payload briefly.
 - get_current_user: Retrieves the authenticated user from a token.
 - create_email_token: Generates a JWT token for email verification.
 - get_email_from_token: Extracts email from a verification token.
 """
 
+import asyncio
+import hashlib
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Optional, Tuple
 
+import bcrypt
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
-from passlib.context import CryptContext
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
-from jose import JWTError, jwt
+import jwt
 
-from src.database.db import get_db
 from src.conf.config import settings
-from src.database.models import User, UserRole
-from src.services.users import UserService
+from src.database.models import UserRole
+from src.services.users import AuthUser, UserService, get_user_service
 
 UTC = timezone.utc
+# Signing keys and the accepted algorithm list, prepared once instead of on every call.
+_JWT_KEY = settings.JWT_SECRET.encode()
+_JWT_REFRESH_KEY = settings.JWT_REFRESH_SECRET.encode()
+_JWT_ALGORITHMS = [settings.JWT_ALGORITHM]
+_ACCESS_TOKEN_TTL = timedelta(seconds=settings.JWT_EXPIRATION_SECONDS)
+_REFRESH_TOKEN_TTL = timedelta(days=10)
+_EMAIL_TOKEN_TTL = timedelta(days=7)
+# Verified access and refresh token payloads, keyed by a digest of the token. They are
+# kept apart because each kind is signed with its own secret. An entry never outlives
+# the token's own ``exp`` claim.
+_token_cache = TTLCache(maxsize=10_000, ttl=60)
+_refresh_token_cache = TTLCache(maxsize=10_000, ttl=60)
+_token_cache_lock = threading.Lock()
+
+
+def _check_password(plain_password: str, hashed_password: str) -> bool:
+    """Check a password against a bcrypt hash (blocking)."""
+    return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
+
+
+def _hash_password(password: str) -> str:
+    """Hash a password with bcrypt at ``settings.BCRYPT_COST`` (blocking)."""
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=settings.BCRYPT_COST)).decode()
+
+
+def _check_and_rehash_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """Check a password and return a new hash if the stored one is outdated (blocking)."""
+    if not _check_password(plain_password, hashed_password):
+        return False, None
+    if Hash.needs_rehash(hashed_password):
+        return True, _hash_password(plain_password)
+    return True, None
+
+
+# bcrypt is pure CPU work, so it runs on a pool sized to the CPU count: the event loop
+# stays free and concurrent logins cannot start more hashing threads than cores.
+_bcrypt_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="bcrypt")
+
+
+async def _run_bcrypt(func, *args):
+    """Run a blocking bcrypt helper on the bcrypt thread pool."""
+    return await asyncio.get_running_loop().run_in_executor(_bcrypt_executor, func, *args)
+
 
 class Hash:
     """
     Class for handling password hashing and verification using bcrypt.
+
+    The cost factor comes from ``settings.BCRYPT_COST``; hashes made with a lower
+    cost are reported for rehashing by ``verify_and_update``. Hashing and verification
+    run on a dedicated thread pool and are awaited.
     """
-    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
-    def verify_password(self, plain_password, hashed_password):
+    @staticmethod
+    async def verify_password(plain_password, hashed_password) -> bool:
         """
         Verify a plain password against a hashed password.
 
@@ -47,19 +101,57 @@ class Hash:
         :param hashed_password: The stored hashed password.
         :return: True if passwords match, False otherwise.
         """
-        return self.pwd_context.verify(plain_password, hashed_password)
+        return await _run_bcrypt(_check_password, plain_password, hashed_password)
 
-    def get_password_hash(self, password: str):
+    @staticmethod
+    async def verify_and_update(plain_password, hashed_password) -> Tuple[bool, Optional[str]]:
+        """
+        Verify a password and rehash it if the stored hash is outdated.
+
+        :param plain_password: The plain text password to check.
+        :param hashed_password: The stored hashed password.
+        :return: Whether the password matches, and a new hash to store or None.
+        """
+        return await _run_bcrypt(_check_and_rehash_password, plain_password, hashed_password)
+
+    @staticmethod
+    def needs_rehash(hashed_password: str) -> bool:
+        """
+        Check whether a hash was made with a lower cost than ``settings.BCRYPT_COST``.
+
+        :param hashed_password: The stored hashed password (``$2b$<cost>$...``).
+        :return: True if the password should be hashed again.
+        """
+        return int(hashed_password.split("$")[2]) < settings.BCRYPT_COST
+
+    @staticmethod
+    async def get_password_hash(password: str) -> str:
         """
         Hash a password using bcrypt.
 
         :param password: The password to hash.
         :return: Hashed password.
         """
-        return self.pwd_context.hash(password)
+        return await _run_bcrypt(_hash_password, password)
+
+    @staticmethod
+    def hash_refresh_token(refresh_token: str):
+        """
+        Hash a refresh token for storage using SHA-256.
+
+        Refresh tokens are random, high-entropy JWTs, so a fast digest is
+        sufficient here and bcrypt's work factor is not needed.
+
+        :param refresh_token: The refresh token to hash.
+        :return: Hex digest of the token.
+        """
+        return hashlib.sha256(refresh_token.encode()).hexdigest()
+
+
+hash_service = Hash()
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
-async def create_access_token(data: dict, expires_delta: Optional[int] = None):
+def create_access_token(data: dict, expires_delta: Optional[int] = None):
     """
     Generate a new JWT access token.
 
@@ -68,18 +160,13 @@ async def create_access_token(data: dict, expires_delta: Optional[int] = None):
     :return: Encoded JWT token.
     """
     to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.now(UTC) + timedelta(seconds=expires_delta)
-    else:
-        expire = datetime.now(UTC) + timedelta(seconds=settings.JWT_EXPIRATION_SECONDS)
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(
-        to_encode, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM
-    )
+    ttl = timedelta(seconds=expires_delta) if expires_delta else _ACCESS_TOKEN_TTL
+    to_encode.update({"exp": int((datetime.now(UTC) + ttl).timestamp())})
+    encoded_jwt = jwt.encode(to_encode, _JWT_KEY, algorithm=settings.JWT_ALGORITHM)
     return encoded_jwt
 
 
-async def create_refresh_token(data: dict, expires_delta: Optional[int] = None):
+def create_refresh_token(data: dict, expires_delta: Optional[int] = None):
     """
        Creates a new refresh token (JWT) for the user.
 
@@ -91,82 +178,132 @@ async def create_refresh_token(data: dict, expires_delta: Optional[int] = None):
            str: The generated JWT refresh token.
     """
     to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.now(UTC) + timedelta(seconds=expires_delta)
-    else:
-        expire = datetime.now(UTC) + timedelta(days=10)
-    to_encode.update({"exp": expire, "token_type": "refresh"})
-
-    encoded_jwt = jwt.encode(
-        to_encode, settings.JWT_REFRESH_SECRET, algorithm=settings.JWT_ALGORITHM
-    )
+    ttl = timedelta(seconds=expires_delta) if expires_delta else _REFRESH_TOKEN_TTL
+    to_encode.update({"exp": int((datetime.now(UTC) + ttl).timestamp()), "token_type": "refresh"})
+
+    encoded_jwt = jwt.encode(to_encode, _JWT_REFRESH_KEY, algorithm=settings.JWT_ALGORITHM)
     return encoded_jwt
 
 
-async def verify_refresh_token(refresh_token: str, db: Session = Depends(get_db)):
+def _decode_cached(token: str, key: bytes, cache: TTLCache, token_type: Optional[str] = None) -> dict:
+    """
+    Decode and verify a JWT, reusing a payload verified recently with the same secret.
+
+    :param token: The encoded JWT.
+    :param key: The key the token must be signed with.
+    :param cache: The payload cache for this kind of token.
+    :param token_type: Required ``token_type`` claim. It is read from the unverified
+        payload first, so a token of the wrong type is rejected before the signature check.
+    :return: The token payload.
+    :raises jwt.InvalidTokenError: If the token is invalid or expired.
+    """
+    digest = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    with _token_cache_lock:
+        payload = cache.get(digest)
+    if payload is not None and payload.get("exp", 0) > time.time():
+        return payload
+
+    if token_type is not None:
+        unverified = jwt.decode(token, options={"verify_signature": False})
+        if unverified.get("token_type") != token_type:
+            raise jwt.InvalidTokenError("Unexpected token type")
+
+    payload = jwt.decode(token, key, algorithms=_JWT_ALGORITHMS)
+    with _token_cache_lock:
+        cache[digest] = payload
+    return payload
+
+
+def decode_access_token(token: str) -> dict:
+    """
+    Decode and verify an access token, reusing recently verified payloads.
+
+    :param token: JWT access token.
+    :return: The token payload.
+    :raises jwt.InvalidTokenError: If the token is invalid or expired.
+    """
+    return _decode_cached(token, _JWT_KEY, _token_cache)
+
+
+def decode_refresh_token(token: str) -> dict:
+    """
+    Decode and verify a refresh token, reusing recently verified payloads.
+
+    :param token: JWT refresh token.
+    :return: The token payload.
+    :raises jwt.InvalidTokenError: If the token is invalid or expired.
+    """
+    return _decode_cached(token, _JWT_REFRESH_KEY, _refresh_token_cache, token_type="refresh")
+
+
+async def verify_refresh_token(refresh_token: str, user_service: UserService):
     """
         Validates the given refresh token and returns the user if valid.
 
+        Only the decoded payload is cached; the user is always loaded from the database
+        so that a rotated refresh token is rejected.
+
+        Tokens stored before digests were introduced are plaintext. Such a token is
+        still accepted once: the refresh endpoint rotates it and stores the new
+        token's digest, so existing sessions are not forced to log in again.
+
         Args:
             refresh_token (str): The refresh token.
-            db (Session): The database session.
+            user_service (UserService): The user service for the request.
 
         Returns:
             User: The user associated with the refresh token or None if invalid.
     """
     try:
-        payload = jwt.decode(
-            refresh_token, settings.JWT_REFRESH_SECRET, algorithms=[settings.JWT_ALGORITHM]
-        )
+        payload = decode_refresh_token(refresh_token)
         username: str = payload.get("sub")
         token_type: str = payload.get("token_type")
 
         if username is None or token_type != "refresh":
             return None
 
-        user_service = UserService(db)
         user = await user_service.get_user_by_username(username)
 
-        if refresh_token != user.refresh_token:
+        if user is None or user.refresh_token not in (hash_service.hash_refresh_token(refresh_token), refresh_token):
             return None
 
         return user
-    except JWTError as err:
+    except jwt.InvalidTokenError as err:
         return None
 
 
 async def get_current_user(
-    token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)
+    token: str = Depends(oauth2_scheme), user_service: UserService = Depends(get_user_service)
 ):
     """
     Retrieve the current authenticated user from the provided token.
 
+    When both the token payload and the user are cached, this returns without
+    awaiting anything.
+
     :param token: JWT access token.
-    :param db: Database session.
-    :return: Authenticated user object.
+    :param user_service: User service for the request.
+    :return: Snapshot of the authenticated user.
     :raises HTTPException: If the token is invalid or user does not exist.
     """
-    credentials_exception = HTTPException(
+    try:
+        username = decode_access_token(token)["sub"]
+    except (jwt.InvalidTokenError, KeyError):
+        username = None
+
+    if username is not None:
+        user = UserService.get_cached_user(username)
+        if user is None:
+            user = await user_service.get_authenticated_user(username)
+        if user is not None:
+            return user
+
+    raise HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    try:
-        payload = jwt.decode(
-            token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
-        )
-        username = payload["sub"]
-        if username is None:
-            raise credentials_exception
-    except JWTError as e:
-        raise credentials_exception
-    user_service = UserService(db)
-    user = await user_service.get_user_by_username(username)
-    if user is None:
-        raise credentials_exception
-    return user
-
 
 def create_email_token(data: dict):
     """
@@ -176,9 +313,9 @@ def create_email_token(data: dict):
     :return: Encoded JWT token.
     """
     to_encode = data.copy()
-    expire = datetime.now(UTC) + timedelta(days=7)
-    to_encode.update({"iat": datetime.now(UTC), "exp": expire})
-    token = jwt.encode(to_encode, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
+    now = datetime.now(UTC)
+    to_encode.update({"iat": int(now.timestamp()), "exp": int((now + _EMAIL_TOKEN_TTL).timestamp())})
+    token = jwt.encode(to_encode, _JWT_KEY, algorithm=settings.JWT_ALGORITHM)
     return token
 
 
@@ -191,19 +328,17 @@ async def get_email_from_token(token: str):
     :raises HTTPException: If the token is invalid.
     """
     try:
-        payload = jwt.decode(
-            token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
-        )
+        payload = jwt.decode(token, _JWT_KEY, algorithms=_JWT_ALGORITHMS)
         email = payload["sub"]
         return email
-    except JWTError as e:
+    except jwt.InvalidTokenError as e:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail="Неправильний токен для перевірки електронної пошти",
         )
 
 
-def get_current_admin_user(current_user: User = Depends(get_current_user)):
+def get_current_admin_user(current_user: AuthUser = Depends(get_current_user)):
     if current_user.role not in [UserRole.ADMIN]:
         raise HTTPException(status_code=403, detail="Недостатньо прав доступу")
     return current_user
\ No newline at end of file
@@ -11,20 +11,27 @@ Classes
 Methods
 -------
 - create_contact: Creates a new contact.
+- create_contacts_bulk: Creates many contacts at once.
 - get_contacts: Retrieves a list of contacts with optional filtering.
 - get_birthdays: Retrieves contacts with upcoming birthdays.
 - get_contact: Retrieves a specific contact by ID.
 - update_contact: Updates an existing contact.
 - remove_contact: Deletes a contact.
+
+Functions
+---------
+- get_contact_service: FastAPI dependency providing a ContactService for the request.
 """
 
-from typing import Optional
+from typing import List, Optional
 
+from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.database.models import User
+from src.database.db import get_db
 from src.repository.contacts import ContactRepository
 from src.schemas import ContactCreate, ContactUpdate
+from src.services.users import AuthUser
 
 class ContactService:
     """
@@ -39,7 +46,7 @@ class ContactService:
         self.repository = ContactRepository(db)
 
 
-    async def create_contact(self, body: ContactCreate, user: User):
+    async def create_contact(self, body: ContactCreate, user: AuthUser):
         """
         Create a new contact for the given user.
 
@@ -50,7 +57,19 @@ class ContactService:
         return await self.repository.create_contact(body, user)
 
 
-    async def get_contacts(self, skip: int, limit: int, user: User, query: Optional[str]=None):
+    async def create_contacts_bulk(self, bodies: List[ContactCreate], user: AuthUser):
+        """
+        Create many contacts for the given user in one statement.
+
+        :param bodies: Contact data for each new contact.
+        :param user: The user creating the contacts.
+        :return: The created contacts.
+        """
+        return await self.repository.create_contacts_bulk(bodies, user)
+
+
+    async def get_contacts(
+            self, skip: int, limit: int, user: AuthUser, query: Optional[str]=None, after_id: Optional[int]=None):
         """
         Retrieve a list of contacts for the given user.
 
@@ -58,22 +77,24 @@ class ContactService:
         :param limit: Maximum number of records to return.
         :param user: The user whose contacts are being retrieved.
         :param query: Optional search query to filter contacts.
-        :return: A list of contacts.
+        :param after_id: Return only contacts after this ID (keyset pagination).
+        :return: A list of contacts, and whether a next page exists.
         """
-        return await self.repository.get_contacts(skip, limit, user, query)
+        return await self.repository.get_contacts(skip, limit, user, query, after_id)
 
 
-    async def get_birthdays(self, user: User):
+    async def get_birthdays(self, user: AuthUser, limit: int = 100):
         """
         Retrieve contacts with upcoming birthdays for the given user.
 
         :param user: The user whose contacts are being checked.
+        :param limit: Maximum number of contacts to return.
         :return: A list of contacts with upcoming birthdays.
         """
-        return await self.repository.get_birthdays(user)
+        return await self.repository.get_birthdays(user, limit)
 
 
-    async def get_contact(self, contact_id: int, user: User):
+    async def get_contact(self, contact_id: int, user: AuthUser):
         """
         Retrieve a specific contact by ID.
 
@@ -84,7 +105,7 @@ class ContactService:
         return await self.repository.get_contact_by_id(contact_id, user)
 
 
-    async def update_contact(self, contact_id: int, body: ContactUpdate, user: User):
+    async def update_contact(self, contact_id: int, body: ContactUpdate, user: AuthUser):
         """
         Update an existing contact.
 
@@ -96,7 +117,7 @@ class ContactService:
         return await self.repository.update_contact(contact_id, body, user)
 
 
-    async def remove_contact(self, contact_id: int, user: User):
+    async def remove_contact(self, contact_id: int, user: AuthUser):
         """
         Delete a contact.
 
@@ -104,4 +125,17 @@ class ContactService:
         :param user: The user requesting deletion.
         :return: The deleted contact.
         """
-        return await self.repository.remove_contact(contact_id, user)
\ No newline at end of file
+        return await self.repository.remove_contact(contact_id, user)
+
+async def get_contact_service(db: AsyncSession = Depends(get_db)) -> ContactService:
+    """
+    Provide a ContactService bound to the request's database session.
+
+    FastAPI resolves it once per request, so all dependencies share one instance.
+    It is async so FastAPI calls it on the event loop instead of sending it to the
+    thread pool.
+
+    :param db: Async database session.
+    :return: The contact service.
+    """
+    return ContactService(db)
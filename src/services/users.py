@@ -6,24 +6,94 @@ This module provides user management services, including user creation, retrieva
 
 Classes
 -------
+- AuthUser: Immutable snapshot of an authenticated user, cached between requests.
 - UserService: Handles operations related to user accounts.
 
 Methods
 -------
-- create_user: Creates a new user and generates a Gravatar avatar if available.
+- create_user: Creates a new user with a Gravatar avatar URL.
 - get_user_by_id: Retrieves a user by their unique ID.
 - get_user_by_username: Retrieves a user by their username.
+- get_cached_user: Returns a user from the in-memory user cache only.
+- get_authenticated_user: Retrieves a user by username through the in-memory user cache.
 - get_user_by_email: Retrieves a user by their email address.
+- get_users_by_email_or_username: Retrieves users matching an email or username.
 - confirmed_email: Confirms a user's email address.
 - update_avatar_url: Updates the avatar URL for a user.
+- update_password: Replaces a user's stored password hash.
+
+Functions
+---------
+- get_user_service: FastAPI dependency providing a UserService for the request.
 """
 
+import hashlib
+from dataclasses import dataclass
+from typing import Optional
+
+from cachetools import TTLCache
+from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
-from libgravatar import Gravatar
 
+from src.conf.config import settings
+from src.database.db import get_db
+from src.database.models import User, UserRole
 from src.repository.users import UserRepository
 from src.schemas import UserCreate
 
+
+@dataclass(frozen=True, slots=True)
+class AuthUser:
+    """
+    Immutable snapshot of the user behind an access token.
+
+    Authenticated requests get this instead of an ORM ``User``, so serving them from
+    the cache needs no session, identity map or attribute instrumentation.
+    """
+    id: int
+    username: str
+    email: str
+    avatar: Optional[str]
+    role: UserRole
+    confirmed: bool
+
+    @classmethod
+    def from_user(cls, user: User) -> "AuthUser":
+        """
+        Take a snapshot of an ORM user.
+
+        :param user: The loaded user.
+        :return: The snapshot.
+        """
+        return cls(
+            id=user.id,
+            username=user.username,
+            email=user.email,
+            avatar=user.avatar,
+            role=user.role,
+            confirmed=user.confirmed,
+        )
+
+
+# Users resolved for authenticated requests, as AuthUser snapshots keyed by username.
+# Writes by email or id get the username back from their UPDATE ... RETURNING, so they
+# can drop the user without secondary keys that the LRU could evict on their own.
+_user_cache = TTLCache(maxsize=10000, ttl=settings.USER_CACHE_TTL_SECONDS)
+
+
+def gravatar_url(email: str) -> str:
+    """
+    Build the Gravatar image URL for an email address.
+
+    The URL only depends on the MD5 of the normalized address, so no request is made.
+
+    :param email: The user's email address.
+    :return: The Gravatar image URL.
+    """
+    email_hash = hashlib.md5(email.strip().lower().encode(), usedforsecurity=False).hexdigest()
+    return f"https://www.gravatar.com/avatar/{email_hash}"
+
+
 class UserService:
     """
     Service class for managing user accounts.
@@ -39,19 +109,13 @@ class UserService:
 
     async def create_user(self, body: UserCreate):
         """
-         Create a new user and assign a Gravatar avatar if available.
+         Create a new user with a Gravatar avatar URL.
 
          :param body: User data for creation.
          :return: The created user object.
          """
-        avatar = None
-        try:
-            g = Gravatar(body.email)
-            avatar = g.get_image()
-        except Exception as e:
-            print(e)
-
-        return await self.repository.create_user(body, avatar)
+        _user_cache.pop(body.username, None)
+        return await self.repository.create_user(body, gravatar_url(body.email))
 
 
     async def get_user_by_id(self, user_id: int):
@@ -74,6 +138,37 @@ class UserService:
         return await self.repository.get_user_by_username(username)
 
 
+    @staticmethod
+    def get_cached_user(username: str) -> Optional[AuthUser]:
+        """
+        Return the user cached for authenticated requests, without querying the database.
+
+        :param username: The username taken from the access token.
+        :return: The cached user, or None if it is not cached.
+        """
+        return _user_cache.get(username)
+
+
+    async def get_authenticated_user(self, username: str) -> Optional[AuthUser]:
+        """
+        Retrieve a user for an authenticated request, using the in-memory cache.
+
+        The result is an ``AuthUser`` snapshot rather than an ORM object. Credential
+        checks (login, refresh tokens) should use ``get_user_by_username``: another
+        worker may have changed the password or rotated the refresh token, and only
+        this process's writes evict the cache.
+
+        :param username: The username taken from the access token.
+        :return: The user snapshot if found.
+        """
+        auth_user = self.get_cached_user(username)
+        if auth_user is None:
+            user = await self.repository.get_user_by_username(username)
+            if user is not None:
+                auth_user = _user_cache[username] = AuthUser.from_user(user)
+        return auth_user
+
+
     async def get_user_by_email(self, email: str):
         """
         Retrieve a user by their email address.
@@ -84,14 +179,25 @@ class UserService:
         return await self.repository.get_user_by_email(email)
 
 
+    async def get_users_by_email_or_username(self, email: str, username: str):
+        """
+        Retrieve users matching either the email or the username in one query.
+
+        :param email: The email to look up.
+        :param username: The username to look up.
+        :return: A list of matching users.
+        """
+        return await self.repository.get_users_by_email_or_username(email, username)
+
+
     async def confirmed_email(self, email: str):
         """
         Confirm a user's email address.
 
         :param email: The email to confirm.
-        :return: The updated user object.
         """
-        return await self.repository.confirmed_email(email)
+        username = await self.repository.confirmed_email(email)
+        _user_cache.pop(username, None)
 
 
     async def update_avatar_url(self, email: str, url: str):
@@ -102,8 +208,41 @@ class UserService:
         :param url: The new avatar URL.
         :return: The updated user object.
         """
-        return await self.repository.update_avatar_url(email, url)
+        user = await self.repository.update_avatar_url(email, url)
+        _user_cache.pop(user.username, None)
+        return user
 
 
     async def set_refresh_token(self, user_id: int, refresh_token: str) -> None:
-        await self.repository.set_refresh_token(user_id, refresh_token)
\ No newline at end of file
+        """
+        Store the hash of a user's current refresh token.
+
+        :param user_id: The ID of the user.
+        :param refresh_token: The refresh token hash.
+        """
+        username = await self.repository.set_refresh_token(user_id, refresh_token)
+        _user_cache.pop(username, None)
+
+    async def update_password(self, user_id: int, hashed_password: str) -> None:
+        """
+        Replace the stored password hash for a user.
+
+        :param user_id: The ID of the user.
+        :param hashed_password: The new password hash.
+        """
+        username = await self.repository.update_password(user_id, hashed_password)
+        _user_cache.pop(username, None)
+
+
+async def get_user_service(db: AsyncSession = Depends(get_db)) -> UserService:
+    """
+    Provide a UserService bound to the request's database session.
+
+    FastAPI resolves it once per request, so the endpoint and ``get_current_user``
+    share one instance. It is async so FastAPI calls it on the event loop instead of
+    sending it to the thread pool.
+
+    :param db: Async database session.
+    :return: The user service.
+    """
+    return UserService(db)
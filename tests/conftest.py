@@ -1,6 +1,5 @@
 import asyncio
 import pytest
-import pytest_asyncio
 from fastapi.testclient import TestClient
 from sqlalchemy.pool import StaticPool
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
@@ -8,7 +7,7 @@ from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from main import app
 from src.database.models import Base, User
 from src.database.db import get_db
-from src.services.auth import create_access_token, Hash
+from src.services.auth import create_access_token, hash_service
 
 import sys
 import os
@@ -41,7 +40,7 @@ def init_models_wrap():
             await conn.run_sync(Base.metadata.drop_all)
             await conn.run_sync(Base.metadata.create_all)
         async with TestingSessionLocal() as session:
-            hash_password = Hash().get_password_hash(test_user["password"])
+            hash_password = await hash_service.get_password_hash(test_user["password"])
             current_user = User(
                 username=test_user["username"],
                 email=test_user["email"],
@@ -73,8 +72,8 @@ def client():
     yield TestClient(app)
 
 
-@pytest_asyncio.fixture()
-async def get_token():
-    token = await create_access_token(data={"sub": test_user["username"]})
+@pytest.fixture()
+def get_token():
+    token = create_access_token(data={"sub": test_user["username"]})
     return token
 
@@ -0,0 +1,10 @@
+import pytest
+from pydantic import ValidationError
+
+from src.conf.config import Settings
+
+
+@pytest.mark.parametrize("cost", [3, 32])
+def test_bcrypt_cost_out_of_range_rejected(cost):
+    with pytest.raises(ValidationError):
+        Settings(BCRYPT_COST=cost)
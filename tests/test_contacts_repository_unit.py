@@ -1,5 +1,6 @@
 import pytest
 from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timedelta
 from src.database.models import Contact, User
@@ -23,12 +24,45 @@ def user():
 @pytest.mark.asyncio
 async def test_get_contacts(contact_repository, mock_session, user):
     mock_result = MagicMock()
-    mock_result.scalars.return_value.all.return_value = [Contact(id=1, first_name="Ivan", last_name="Ivanov", user=user)]
+    mock_result.mappings.return_value.all.return_value = [{"id": 1, "first_name": "Ivan", "last_name": "Ivanov"}]
     mock_session.execute = AsyncMock(return_value=mock_result)
-    contacts = await contact_repository.get_contacts(skip=0, limit=10, user=user)
+    contacts, has_next = await contact_repository.get_contacts(skip=0, limit=10, user=user)
+    assert has_next is False
     assert len(contacts) == 1
-    assert contacts[0].first_name == "Ivan"
-    assert contacts[0].last_name == "Ivanov"
+    assert contacts[0]["first_name"] == "Ivan"
+    assert contacts[0]["last_name"] == "Ivanov"
+
+
+@pytest.mark.asyncio
+async def test_get_contacts_word_query_uses_full_text_search(contact_repository, mock_session, user):
+    mock_session.bind = MagicMock()
+    mock_session.bind.dialect.name = "postgresql"
+    mock_result = MagicMock()
+    mock_result.mappings.return_value.all.return_value = []
+    mock_session.execute = AsyncMock(return_value=mock_result)
+
+    await contact_repository.get_contacts(skip=0, limit=10, user=user, query="ivan iv")
+    stmt = mock_session.execute.await_args.args[0]
+    assert "@@ to_tsquery" in str(stmt.compile(dialect=postgresql.dialect()))
+
+    await contact_repository.get_contacts(skip=0, limit=10, user=user, query="gmail")
+    stmt = mock_session.execute.await_args.args[0]
+    compiled = stmt.compile(dialect=postgresql.dialect())
+    assert "translate(coalesce(contacts.email, ''), '@.', '  ')) @@ to_tsquery" in str(compiled)
+    assert "ILIKE" not in str(compiled)
+    assert compiled.params["terms_1"] == "gmail:*"
+
+    await contact_repository.get_contacts(skip=0, limit=10, user=user, query="ivan@example")
+    stmt = mock_session.execute.await_args.args[0]
+    assert "ILIKE" in str(stmt.compile(dialect=postgresql.dialect()))
+
+    for query in ("iv", "i."):
+        await contact_repository.get_contacts(skip=0, limit=10, user=user, query=query)
+        stmt = mock_session.execute.await_args.args[0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "lower(contacts.first_name) LIKE" in sql
+        assert "ILIKE" not in sql
+        assert "to_tsquery" not in sql
 
 
 @pytest.mark.asyncio
@@ -63,13 +97,36 @@ async def test_create_contact(contact_repository, mock_session, user):
     mock_session.refresh.assert_awaited_once_with(result)
 
 
+@pytest.mark.asyncio
+async def test_create_contacts_bulk(contact_repository, mock_session, user):
+    bodies = [
+        ContactCreate(first_name="Ivan", last_name="Ivanov", email="ivan@example.com",
+                      phone="+0123456789", birth_date="2020-01-01"),
+        ContactCreate(first_name="Petro", last_name="Petrenko", email="petro@example.com",
+                      phone="+0123456780", birth_date="2020-02-02"),
+    ]
+    created = [Contact(id=1, first_name="Ivan"), Contact(id=2, first_name="Petro")]
+    mock_result = MagicMock()
+    mock_result.all.return_value = created
+    mock_session.scalars = AsyncMock(return_value=mock_result)
+
+    result = await contact_repository.create_contacts_bulk(bodies, user)
+
+    assert result == created
+    rows = mock_session.scalars.await_args.args[1]
+    assert [row["first_name"] for row in rows] == ["Ivan", "Petro"]
+    assert all(row["user_id"] == user.id for row in rows)
+    mock_session.scalars.assert_awaited_once()
+    mock_session.commit.assert_awaited_once()
+
+
 @pytest.mark.asyncio
 async def test_update_contact(contact_repository, mock_session, user):
 
     contact_data = ContactUpdate(first_name="Updated Ivan", last_name="Updated Ivanov")
-    existing_contact = Contact(id=1, first_name="Ivan", last_name="Ivanov", user=user)
+    updated_contact = Contact(id=1, first_name="Updated Ivan", last_name="Updated Ivanov", user=user)
     mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = existing_contact
+    mock_result.scalar_one_or_none.return_value = updated_contact
     mock_session.execute = AsyncMock(return_value=mock_result)
 
     result = await contact_repository.update_contact(contact_id=1, body=contact_data, user=user)
@@ -77,8 +134,12 @@ async def test_update_contact(contact_repository, mock_session, user):
     assert result is not None
     assert result.first_name == "Updated Ivan"
     assert result.last_name == "Updated Ivanov"
+    stmt = mock_session.execute.await_args.args[0]
+    assert set(stmt.compile().params) >= {"first_name", "last_name"}
+    assert "email" not in stmt.compile().params
+    mock_session.execute.assert_awaited_once()
     mock_session.commit.assert_awaited_once()
-    mock_session.refresh.assert_awaited_once_with(existing_contact)
+    mock_session.refresh.assert_not_awaited()
 
 
 @pytest.mark.asyncio
@@ -94,7 +155,8 @@ async def test_remove_contact(contact_repository, mock_session, user):
     assert result is not None
     assert result.first_name == "Ivan"
     assert result.last_name == "Ivanov"
-    mock_session.delete.assert_awaited_once_with(existing_contact)
+    mock_session.execute.assert_awaited_once()
+    mock_session.delete.assert_not_awaited()
     mock_session.commit.assert_awaited_once()
 
 
@@ -0,0 +1,25 @@
+from sqlalchemy.pool import NullPool
+
+from src.conf.config import settings
+from src.database.db import engine_options
+
+
+def test_engine_options_pool(monkeypatch):
+    monkeypatch.setattr("src.database.db.settings", settings.model_copy(update={"DB_USE_PGBOUNCER": False}))
+    options = engine_options()
+    assert options["pool_size"] == settings.DB_POOL_SIZE
+    assert options["max_overflow"] == settings.DB_MAX_OVERFLOW
+    assert options["pool_pre_ping"] is True
+    assert "poolclass" not in options
+
+
+def test_engine_options_pgbouncer(monkeypatch):
+    monkeypatch.setattr("src.database.db.settings", settings.model_copy(update={"DB_USE_PGBOUNCER": True}))
+    options = engine_options()
+    assert options["poolclass"] is NullPool
+    connect_args = options["connect_args"]
+    assert connect_args["statement_cache_size"] == 0
+    assert connect_args["prepared_statement_cache_size"] == 0
+    name_func = connect_args["prepared_statement_name_func"]
+    assert name_func() != name_func()
+    assert name_func().startswith("__asyncpg_")
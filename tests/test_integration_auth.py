@@ -1,3 +1,4 @@
+import bcrypt
 import pytest
 from sqlalchemy import select
 
@@ -5,7 +6,6 @@ from src.conf.config import settings
 from src.database.models import User
 from src.services.users import UserService
 from tests.conftest import TestingSessionLocal
-from jose import jwt
 from unittest.mock import patch, MagicMock, AsyncMock, Mock
 
 
@@ -58,6 +58,25 @@ async def test_login(client):
     assert "token_type" in data
 
 
+@pytest.mark.asyncio
+async def test_login_rehashes_low_cost_password(client):
+    low_cost_hash = bcrypt.hashpw(user_data["password"].encode(), bcrypt.gensalt(rounds=4)).decode()
+    async with TestingSessionLocal() as session:
+        current_user = await session.execute(select(User).where(User.email == user_data.get("email")))
+        current_user = current_user.scalar_one()
+        current_user.hashed_password = low_cost_hash
+        await session.commit()
+
+    response = client.post("api/auth/login",
+                           data={"username": user_data.get("username"), "password": user_data.get("password")})
+    assert response.status_code == 200, response.text
+
+    async with TestingSessionLocal() as session:
+        current_user = await session.execute(select(User).where(User.email == user_data.get("email")))
+        hashed_password = current_user.scalar_one().hashed_password
+    assert hashed_password.startswith(f"$2b${settings.BCRYPT_COST:02d}$")
+
+
 def test_wrong_password_login(client):
     response = client.post("api/auth/login",
                            data={"username": user_data.get("username"), "password": "password"})
@@ -79,6 +98,69 @@ def test_validation_error_login(client):
     assert "detail" in data
 
 
+def test_refresh_token(client):
+    response = client.post("api/auth/login",
+                           data={"username": user_data.get("username"), "password": user_data.get("password")})
+    assert response.status_code == 200, response.text
+    refresh_token = response.json()["refresh_token"]
+
+    response = client.post("api/auth/token-refresh", headers={"Authorization": f"Bearer {refresh_token}"})
+    assert response.status_code == 200, response.text
+    data = response.json()
+    assert "access_token" in data
+
+    response = client.post("api/auth/token-refresh", headers={"Authorization": f"Bearer {data['refresh_token']}"})
+    assert response.status_code == 200, response.text
+
+
+def test_refresh_token_rotated_token_rejected(client):
+    response = client.post("api/auth/login",
+                           data={"username": user_data.get("username"), "password": user_data.get("password")})
+    assert response.status_code == 200, response.text
+    refresh_token = response.json()["refresh_token"]
+
+    with patch("src.api.auth.create_refresh_token", return_value="rotated-token"):
+        response = client.post("api/auth/token-refresh", headers={"Authorization": f"Bearer {refresh_token}"})
+    assert response.status_code == 200, response.text
+
+    response = client.post("api/auth/token-refresh", headers={"Authorization": f"Bearer {refresh_token}"})
+    assert response.status_code == 401, response.text
+
+
+@pytest.mark.asyncio
+async def test_refresh_token_legacy_plaintext_accepted_once(client):
+    response = client.post("api/auth/login",
+                           data={"username": user_data.get("username"), "password": user_data.get("password")})
+    assert response.status_code == 200, response.text
+    refresh_token = response.json()["refresh_token"]
+
+    async with TestingSessionLocal() as session:
+        current_user = await session.scalar(select(User).where(User.username == user_data["username"]))
+        current_user.refresh_token = refresh_token
+        await session.commit()
+
+    with patch("src.api.auth.create_refresh_token", return_value="rotated-token"):
+        response = client.post("api/auth/token-refresh", headers={"Authorization": f"Bearer {refresh_token}"})
+    assert response.status_code == 200, response.text
+
+    async with TestingSessionLocal() as session:
+        current_user = await session.scalar(select(User).where(User.username == user_data["username"]))
+        assert current_user.refresh_token not in (refresh_token, "rotated-token")
+
+    response = client.post("api/auth/token-refresh", headers={"Authorization": f"Bearer {refresh_token}"})
+    assert response.status_code == 401, response.text
+
+
+def test_refresh_with_access_token_rejected(client):
+    response = client.post("api/auth/login",
+                           data={"username": user_data.get("username"), "password": user_data.get("password")})
+    assert response.status_code == 200, response.text
+    access_token = response.json()["access_token"]
+
+    response = client.post("api/auth/token-refresh", headers={"Authorization": f"Bearer {access_token}"})
+    assert response.status_code == 401, response.text
+
+
 @pytest.mark.asyncio
 async def test_request_email_confirmed(client):
     email_data = {"email": "agent007@gmail.com"}
@@ -94,4 +176,28 @@ async def test_request_email_confirmed(client):
     response = client.post("api/auth/request_email", json=email_data)
     assert response.status_code == 200, response.text
     data = response.json()
-    assert data["message"] == "Ваша електронна пошта вже підтверджена"
\ No newline at end of file
+    assert data["message"] == "Ваша електронна пошта вже підтверджена"
+
+
+def test_request_email_unknown_user(client, monkeypatch):
+    mock_send_email = Mock()
+    monkeypatch.setattr("src.api.auth.send_email", mock_send_email)
+    response = client.post("api/auth/request_email", json={"email": "unknown@gmail.com"})
+    assert response.status_code == 200, response.text
+    assert response.json()["message"] == "Перевірте свою електронну пошту для підтвердження"
+    mock_send_email.assert_not_called()
+
+
+def test_request_email_throttled(client, monkeypatch):
+    monkeypatch.setattr("src.api.auth.send_email", Mock())
+    new_user = {"username": "agent008", "email": "agent008@gmail.com", "password": "12345678", "role": "user"}
+    response = client.post("api/auth/register", json=new_user)
+    assert response.status_code == 201, response.text
+
+    mock_send_email = Mock()
+    monkeypatch.setattr("src.api.auth.send_email", mock_send_email)
+    for _ in range(2):
+        response = client.post("api/auth/request_email", json={"email": new_user["email"]})
+        assert response.status_code == 200, response.text
+        assert response.json()["message"] == "Перевірте свою електронну пошту для підтвердження"
+    mock_send_email.assert_called_once()
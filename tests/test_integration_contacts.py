@@ -1,4 +1,11 @@
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from src.database.models import Contact, User
+from src.repository.contacts import ContactRepository
+from tests.conftest import TestingSessionLocal
 
 contact_data = {
         "first_name": "Ivan",
@@ -50,6 +57,41 @@ def test_get_contacts(client, get_token):
     assert len(data) > 0
     assert "id" in data[0]
 
+def test_get_contacts_query(client, get_token):
+    headers = {"Authorization": f"Bearer {get_token}"}
+    for query in ("IVANOV", "ivan ivanov", "ivanov@example"):
+        response = client.get("/api/contacts", params={"query": query}, headers=headers)
+        assert response.status_code == 200, response.text
+        assert [item["id"] for item in response.json()] == [1]
+
+    response = client.get("/api/contacts", params={"query": "petrenko"}, headers=headers)
+    assert response.status_code == 200, response.text
+    assert response.json() == []
+
+def test_get_contacts_short_query_matches_prefix(client, get_token):
+    headers = {"Authorization": f"Bearer {get_token}"}
+    response = client.get("/api/contacts", params={"query": "Iv"}, headers=headers)
+    assert response.status_code == 200, response.text
+    assert [item["id"] for item in response.json()] == [1]
+
+    for query in ("va", "I%"):
+        response = client.get("/api/contacts", params={"query": query}, headers=headers)
+        assert response.status_code == 200, response.text
+        assert response.json() == []
+
+def test_get_contacts_limit_too_large(client, get_token):
+    response = client.get("/api/contacts", params={"limit": 100000}, headers={"Authorization": f"Bearer {get_token}"})
+    assert response.status_code == 422, response.text
+
+def test_get_contacts_after_id(client, get_token):
+    response = client.get("/api/contacts", params={"after_id": 1}, headers={"Authorization": f"Bearer {get_token}"})
+    assert response.status_code == 200, response.text
+    assert response.json() == []
+
+    response = client.get("/api/contacts", params={"after_id": 0}, headers={"Authorization": f"Bearer {get_token}"})
+    assert response.status_code == 200, response.text
+    assert response.json()[0]["id"] == 1
+
 def test_update_contact(client, get_token):
     contact_update_data = {
         "first_name": "Ivan Updated",
@@ -69,6 +111,18 @@ def test_update_contact(client, get_token):
     assert data["email"] == "ivan.updated@example.com"
     assert "id" in data
 
+def test_update_contact_partial(client, get_token):
+    response = client.put(
+        "/api/contacts/1",
+        json={"phone": "111222333"},
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == 200, response.text
+    data = response.json()
+    assert data["phone"] == "111222333"
+    assert data["first_name"] == "Ivan Updated"
+    assert data["email"] == "ivan.updated@example.com"
+
 def test_update_contact_not_found(client, get_token):
     contact_update_data = {
         "first_name": "Nonexistent Contact",
@@ -117,4 +171,101 @@ def test_get_upcoming_birthdays(client, get_token):
     data = response.json()
     assert isinstance(data, list)
     assert len(data) > 0
-    assert "birth_date" in data[0]
\ No newline at end of file
+    assert "birth_date" in data[0]
+
+def test_get_upcoming_birthdays_ignores_birth_year(client, get_token):
+    tomorrow = (datetime.now() + timedelta(days=1)).date()
+    birth_date = tomorrow.replace(year=1988)  # leap year, so Feb 29 is valid too
+
+    contact = {**contact_data, "birth_date": birth_date.strftime("%Y-%m-%d"), "email": "birth1988@gmail.com"}
+    res = client.post("/api/contacts", json=contact, headers={"Authorization": f"Bearer {get_token}"})
+    assert res.status_code == 201, res.text
+
+    response = client.get("/api/contacts/birthdays", headers={"Authorization": f"Bearer {get_token}"})
+    assert response.status_code == 200, response.text
+    assert "birth1988@gmail.com" in [item["email"] for item in response.json()]
+
+
+def test_create_contacts_bulk(client, get_token):
+    contacts = [
+        {**contact_data, "first_name": "Bulk1", "email": "bulk1@example.com"},
+        {**contact_data, "first_name": "Bulk2", "email": "bulk2@example.com", "additional_data": "note"},
+    ]
+    response = client.post(
+        "/api/contacts/bulk",
+        json=contacts,
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == 201, response.text
+    data = response.json()
+    assert [item["first_name"] for item in data] == ["Bulk1", "Bulk2"]
+    assert data[1]["additional_data"] == "note"
+    assert data[0]["id"] < data[1]["id"]
+
+    response = client.get(
+        f"/api/contacts/{data[1]['id']}", headers={"Authorization": f"Bearer {get_token}"}
+    )
+    assert response.status_code == 200, response.text
+
+
+def test_get_contacts_has_next(client, get_token):
+    headers = {"Authorization": f"Bearer {get_token}"}
+    response = client.get("/api/contacts", params={"limit": 1}, headers={**headers, "Origin": "http://localhost:8000"})
+    assert response.status_code == 200, response.text
+    assert len(response.json()) == 1
+    assert response.headers["X-Has-Next"] == "true"
+    assert "X-Has-Next" in response.headers["Access-Control-Expose-Headers"]
+
+    response = client.get("/api/contacts", params={"limit": 1000}, headers=headers)
+    assert response.status_code == 200, response.text
+    assert len(response.json()) > 1
+    assert response.headers["X-Has-Next"] == "false"
+
+
+@pytest.mark.asyncio
+async def test_get_contacts_query_matches_contact_with_null_field(client):
+    async with TestingSessionLocal() as session:
+        owner = User(username="nullsearch", email="nullsearch@example.com", hashed_password="x")
+        session.add(owner)
+        await session.flush()
+        session.add(Contact(first_name="Ivan", last_name=None, email="ivan@x.com", phone="1", user_id=owner.id))
+        await session.commit()
+
+        repository = ContactRepository(session)
+        for query in ("ivan", "ivan@x"):
+            contacts, _ = await repository.get_contacts(skip=0, limit=10, user=owner, query=query)
+            assert [contact["email"] for contact in contacts] == ["ivan@x.com"]
+
+
+class LateDecemberDate(date):
+    @classmethod
+    def today(cls):
+        return cls(2026, 12, 28)
+
+
+@pytest.mark.asyncio
+async def test_get_birthdays_wraps_over_new_year(client):
+    birthdays = {
+        "dec27": date(1990, 12, 27),
+        "dec28": date(1985, 12, 28),
+        "dec31": date(2001, 12, 31),
+        "jan01": date(1979, 1, 1),
+        "jan04": date(1995, 1, 4),
+        "jan05": date(1992, 1, 5),
+        "jun15": date(1990, 6, 15),
+    }
+    async with TestingSessionLocal() as session:
+        owner = User(username="newyear", email="newyear@example.com", hashed_password="x")
+        session.add(owner)
+        await session.flush()
+        session.add_all([
+            Contact(first_name=name, last_name="Birthday", email=f"{name}@example.com", phone="1",
+                    birth_date=birth_date, user_id=owner.id)
+            for name, birth_date in birthdays.items()
+        ])
+        await session.commit()
+
+        with patch("src.repository.contacts.date", LateDecemberDate):
+            contacts = await ContactRepository(session).get_birthdays(owner)
+
+    assert [contact.first_name for contact in contacts] == ["dec28", "dec31", "jan01", "jan04"]
@@ -4,6 +4,9 @@ from tests.conftest import get_token
 import pytest
 from unittest.mock import patch, MagicMock, AsyncMock
 from src.database.models import User, UserRole
+from src.services.auth import create_access_token
+from src.services.users import AuthUser, UserService, _user_cache
+from tests.conftest import TestingSessionLocal
 
 
 user_data = {
@@ -25,6 +28,70 @@ async def test_get_user_profile(client, monkeypatch, get_token):
     assert data["username"] == "deadpool"
 
 
+def test_get_user_profile_not_modified(client, get_token):
+    response = client.get(
+        "api/users/me", headers={"Authorization": f"Bearer {get_token}"}
+    )
+    assert response.status_code == 200, response.text
+    etag = response.headers["ETag"]
+    assert response.headers["Cache-Control"] == "private, max-age=30"
+
+    response = client.get(
+        "api/users/me", headers={"Authorization": f"Bearer {get_token}", "If-None-Match": etag}
+    )
+    assert response.status_code == 304, response.text
+    assert response.content == b""
+
+
+def test_get_user_profile_reuses_decoded_token(client, get_token):
+    client.get("api/users/me", headers={"Authorization": f"Bearer {get_token}"})
+
+    with patch("src.services.auth.jwt.decode") as mock_decode:
+        response = client.get(
+            "api/users/me", headers={"Authorization": f"Bearer {get_token}"}
+        )
+    assert response.status_code == 200, response.text
+    mock_decode.assert_not_called()
+
+
+def test_get_user_profile_token_without_subject(client):
+    token = create_access_token(data={"role": "admin"})
+    response = client.get("api/users/me", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 401, response.text
+
+
+@pytest.mark.asyncio
+async def test_get_authenticated_user_caches_snapshot(client):
+    async with TestingSessionLocal() as session:
+        user = await UserService(session).get_authenticated_user("deadpool")
+
+    assert isinstance(user, AuthUser)
+    assert user.email == "deadpool@example.com"
+    assert _user_cache["deadpool"] is user
+
+
+@pytest.mark.asyncio
+async def test_set_refresh_token_evicts_cached_user(client, get_token):
+    client.get("api/users/me", headers={"Authorization": f"Bearer {get_token}"})
+    assert "deadpool" in _user_cache
+
+    async with TestingSessionLocal() as session:
+        await UserService(session).set_refresh_token(1, "token_hash")
+
+    assert "deadpool" not in _user_cache
+
+
+@pytest.mark.asyncio
+async def test_confirmed_email_evicts_cached_user(client, get_token):
+    client.get("api/users/me", headers={"Authorization": f"Bearer {get_token}"})
+    assert "deadpool" in _user_cache
+
+    async with TestingSessionLocal() as session:
+        await UserService(session).confirmed_email("deadpool@example.com")
+
+    assert "deadpool" not in _user_cache
+
+
 def test_update_user_avatar(client, get_token):
     image_content = b"fake_image_data"
     image_file = BytesIO(image_content)
@@ -3,6 +3,13 @@ from unittest.mock import AsyncMock, patch
 from fastapi import status, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.api import utils
+
+
+@pytest.fixture(autouse=True)
+def reset_healthcheck_cache():
+    utils._last_healthy_at = None
+
 
 @pytest.mark.asyncio
 async def test_healthchecker_success(client):
@@ -35,4 +42,19 @@ async def test_healthchecker_db_connection_error(client, monkeypatch):
     response = client.get("api/healthchecker")
 
     assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
-    assert response.json() == {"detail": "Error connecting to the database"}
\ No newline at end of file
+    assert response.json() == {"detail": "Error connecting to the database"}
+
+
+@pytest.mark.asyncio
+async def test_healthchecker_cached_success(client, monkeypatch):
+    response = client.get("api/healthchecker")
+    assert response.status_code == status.HTTP_200_OK
+
+    async def mock_execute(_):
+        raise Exception("Database connection failed")
+
+    monkeypatch.setattr(AsyncSession, "execute", mock_execute)
+
+    response = client.get("api/healthchecker")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"message": "Welcome to FastAPI!"}
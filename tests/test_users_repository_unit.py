@@ -25,9 +25,7 @@ def user():
 @pytest.mark.asyncio
 async def test_get_user_by_id(user_repository, mock_session, user):
 
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = user
-    mock_session.execute = AsyncMock(return_value=mock_result)
+    mock_session.get = AsyncMock(return_value=user)
 
 
     result = await user_repository.get_user_by_id(user_id=1)
@@ -37,6 +35,8 @@ async def test_get_user_by_id(user_repository, mock_session, user):
     assert result.id == 1
     assert result.username == "testuser"
     assert result.email == "test@example.com"
+    mock_session.get.assert_awaited_once_with(User, 1)
+    mock_session.execute.assert_not_awaited()
 
 
 @pytest.mark.asyncio
@@ -67,6 +67,20 @@ async def test_get_user_by_email(user_repository, mock_session, user):
     assert result.username == "testuser"
 
 
+@pytest.mark.asyncio
+async def test_get_users_by_email_or_username(user_repository, mock_session, user):
+
+    mock_result = MagicMock()
+    mock_result.scalars.return_value.all.return_value = [user]
+    mock_session.execute = AsyncMock(return_value=mock_result)
+
+    result = await user_repository.get_users_by_email_or_username(email="other@example.com", username="testuser")
+
+    assert len(result) == 1
+    assert result[0].username == "testuser"
+    mock_session.execute.assert_awaited_once()
+
+
 @pytest.mark.asyncio
 async def test_create_user(user_repository, mock_session):
     user_data = UserCreate(
@@ -88,28 +102,56 @@ async def test_create_user(user_repository, mock_session):
 
 
 @pytest.mark.asyncio
-async def test_confirmed_email():
-    mock_session = AsyncMock()
-    repo = UserRepository(mock_session)
-    mock_user = User(email="test@example.com", confirmed=False, role="admin")
-    repo.get_user_by_email = AsyncMock(return_value=mock_user)
+async def test_confirmed_email(user_repository, mock_session):
+    mock_result = MagicMock()
+    mock_result.scalar_one_or_none.return_value = "testuser"
+    mock_session.execute = AsyncMock(return_value=mock_result)
 
-    await repo.confirmed_email("test@example.com")
+    assert await user_repository.confirmed_email("test@example.com") == "testuser"
 
-    assert mock_user.confirmed is True
-    mock_session.commit.assert_awaited()
+    stmt = mock_session.execute.await_args.args[0]
+    assert stmt.compile().params["confirmed"] is True
+    mock_session.execute.assert_awaited_once()
+    mock_session.commit.assert_awaited_once()
 
 
 @pytest.mark.asyncio
-async def test_update_avatar_url():
-    mock_session = AsyncMock()
-    repo = UserRepository(mock_session)
+async def test_set_refresh_token(user_repository, mock_session):
+    mock_result = MagicMock()
+    mock_result.scalar_one_or_none.return_value = "testuser"
+    mock_session.execute = AsyncMock(return_value=mock_result)
 
-    mock_user = User(email="test@example.com", avatar="old_url", role="admin")
-    repo.get_user_by_email = AsyncMock(return_value=mock_user)
+    assert await user_repository.set_refresh_token(1, "token_hash") == "testuser"
 
-    updated_user = await repo.update_avatar_url("test@example.com", "new_url")
+    stmt = mock_session.execute.await_args.args[0]
+    assert stmt.compile().params["refresh_token"] == "token_hash"
+    mock_session.execute.assert_awaited_once()
+    mock_session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_update_avatar_url(user_repository, mock_session):
+    mock_user = User(email="test@example.com", avatar="new_url", role="admin")
+    mock_result = MagicMock()
+    mock_result.scalar_one.return_value = mock_user
+    mock_session.execute = AsyncMock(return_value=mock_result)
+
+    updated_user = await user_repository.update_avatar_url("test@example.com", "new_url")
 
     assert updated_user.avatar == "new_url"
-    mock_session.commit.assert_awaited()
-    mock_session.refresh.assert_awaited_with(mock_user)
\ No newline at end of file
+    stmt = mock_session.execute.await_args.args[0]
+    assert stmt.compile().params["avatar"] == "new_url"
+    mock_session.execute.assert_awaited_once()
+    mock_session.commit.assert_awaited_once()
+    mock_session.refresh.assert_not_awaited()
+
+@pytest.mark.asyncio
+async def test_update_password(user_repository, mock_session):
+    mock_result = MagicMock()
+    mock_result.scalar_one_or_none.return_value = "testuser"
+    mock_session.execute = AsyncMock(return_value=mock_result)
+
+    assert await user_repository.update_password(1, "new_hash") == "testuser"
+
+    mock_session.execute.assert_awaited_once()
+    mock_session.commit.assert_awaited_once()